@@ -11,6 +11,8 @@ import time
 import math
 import json
 
+import numpy as np
+
 
 @dataclass
 class QuantumOptimizationState:
@@ -34,9 +36,10 @@ class AeromorphicMaterial:
 class QuantumAssistedOptimizer:
     """Quantum algorithm engine for lattice reconfiguration optimization (no matter transport)"""
     
-    def __init__(self, material: AeromorphicMaterial):
+    def __init__(self, material: AeromorphicMaterial, rng: Optional[np.random.Generator] = None):
         self.material = material
-        self.optimization_cache = {}
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.optimization_cache: Dict[Tuple[str, str], Dict] = {}
         self.algorithm_state = {}
         self.reconfiguration_time = material.reconfiguration_time
         
@@ -51,10 +54,9 @@ class QuantumAssistedOptimizer:
         success_probability = min(0.95, 0.8 + (self.material.reconfiguration_time / 10.0))
         
         
-        if random.random() < success_probability:
-            # Store optimized reconfiguration pattern
-            pattern_key = f"{cell_id_1}_{cell_id_2}"
-            self.optimization_cache[pattern_key] = {
+        if self.rng.random() < success_probability:
+            # Store optimized reconfiguration pattern, keyed by the cell-id pair
+            self.optimization_cache[(cell_id_1, cell_id_2)] = {
                 "optimized_path": self._calculate_optimal_path(cell_id_1, cell_id_2),
                 "energy_cost": self.material.energy_per_reconfiguration,
                 "classical_duration": self.reconfiguration_time
@@ -65,8 +67,7 @@ class QuantumAssistedOptimizer:
     def _calculate_optimal_path(self, cell_1: str, cell_2: str) -> List[Dict]:
         """Calculate optimal classical reconfiguration path using quantum algorithms"""
         # Quantum algorithms (QAOA, VQE) find optimal path - no matter transport
-        import random
-        path_length = random.randint(3, 8)
+        path_length = int(self.rng.integers(3, 9))
         optimal_path = []
         
         for i in range(path_length):
@@ -104,19 +105,17 @@ class QuantumAssistedOptimizer:
     def _run_quantum_optimization(self, target_profile: Dict) -> Dict[str, float]:
         """Run quantum optimization algorithm (QAOA/VQE) for classical reconfiguration"""
         # Quantum algorithms find optimal parameters for classical movements
-        import random
         return {
-            "qaoa_depth": random.randint(3, 10),
-            "vqe_iterations": random.randint(50, 200),
-            "optimization_energy": random.uniform(0.1, 0.5),
+            "qaoa_depth": int(self.rng.integers(3, 11)),
+            "vqe_iterations": int(self.rng.integers(50, 201)),
+            "optimization_energy": float(self.rng.uniform(0.1, 0.5)),
             "classical_cost": self.material.energy_per_reconfiguration
         }
     
     def _calculate_cost_landscape(self, cells: List[str], positions: List[float]) -> List[float]:
         """Calculate cost landscape for classical reconfiguration optimization"""
         # Quantum algorithms optimize this classical cost function
-        import random
-        return [random.uniform(0.1, 1.0) for _ in range(len(cells))]
+        return self.rng.uniform(0.1, 1.0, len(cells)).tolist()
 
     def _calculate_fidelity(self, original_state: List[float], teleported_state: List[float]) -> float:
         """Calculate quantum fidelity between original and teleported states"""
@@ -124,40 +123,63 @@ class QuantumAssistedOptimizer:
         if len(original_state) != len(teleported_state):
             return 0.0
 
-        dot_product = sum(a * b for a, b in zip(original_state, teleported_state))
+        # Promote to float32 for the inner product; stored states may be compact
+        dot_product = float(np.dot(np.asarray(original_state, dtype=np.float32),
+                                   np.asarray(teleported_state, dtype=np.float32)))
         return min(1.0, max(0.0, dot_product ** 2))
 
 
 class AeromorphicLattice:
     """Classical aeromorphic material structure with quantum-assisted optimization"""
     
-    def __init__(self, dimensions: Tuple[int, int, int]):
+    def __init__(self, dimensions: Tuple[int, int, int], seed: Optional[int] = None):
         self.dimensions = dimensions
-        self.cells = self._initialize_classical_cells()
+        # Root of all random streams for this lattice; fixed seeds make runs reproducible
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._initialize_classical_cells()
         self.material = AeromorphicMaterial(
             lattice_structure="hexagonal",
             reconfiguration_time=0.5,  # Classical reconfiguration: 0.1-1s
             optimization_capacity=10,
             energy_per_reconfiguration=0.01  # Classical energy cost in Joules
         )
-        self.quantum_optimizer = QuantumAssistedOptimizer(self.material)
+        self.quantum_optimizer = QuantumAssistedOptimizer(self.material, self.spawn_rngs(1)[0])
+    
+    def spawn_rngs(self, n_workers: int) -> List[np.random.Generator]:
+        """Derive independent random generators for parallel optimization workers"""
+        return [np.random.default_rng(child) for child in self._seed_seq.spawn(n_workers)]
     
-    def _initialize_classical_cells(self) -> Dict[str, Dict]:
-        """Initialize classical cellular structure (no quantum states)"""
-        cells = {}
+    def _initialize_classical_cells(self) -> None:
+        """Initialize classical cellular structure (no quantum states)
+
+        Cell state is kept in contiguous arrays indexed by ``cell_index``
+        rather than one dict per cell: positions as (N, 3) float32 and
+        energy levels as (N,) float32.
+        """
         x_dim, y_dim, z_dim = self.dimensions
+        grid = np.indices((x_dim, y_dim, z_dim), dtype=np.float32)
         
-        for x in range(x_dim):
-            for y in range(y_dim):
-                for z in range(z_dim):
-                    cell_id = f"cell_{x}_{y}_{z}"
-                    cells[cell_id] = {
-                        "position": [float(x), float(y), float(z)],
-                        "material_state": "solid",  # Classical material state
-                        "reconfiguration_ready": True,
-                        "energy_level": 0.0
-                    }
-        return cells
+        self.cell_ids: List[str] = [
+            f"cell_{x}_{y}_{z}"
+            for x in range(x_dim)
+            for y in range(y_dim)
+            for z in range(z_dim)
+        ]
+        self.cell_index: Dict[str, int] = {cell_id: i for i, cell_id in enumerate(self.cell_ids)}
+        self.positions = np.ascontiguousarray(grid.reshape(3, -1).T)
+        self.energy = np.zeros(len(self.cell_ids), dtype=np.float32)
+        self.reconfiguration_ready = np.ones(len(self.cell_ids), dtype=bool)
+        self.material_state = "solid"  # Classical material state, uniform across cells
+    
+    def get_cell(self, cell_id: str) -> Dict:
+        """Return a dict view of a single cell's classical state"""
+        i = self.cell_index[cell_id]
+        return {
+            "position": self.positions[i].tolist(),
+            "material_state": self.material_state,
+            "reconfiguration_ready": bool(self.reconfiguration_ready[i]),
+            "energy_level": float(self.energy[i])
+        }
     
     def optimize_aerodynamic_profile(self, target_profile: Dict) -> bool:
         """Optimize aerodynamic profile using quantum-assisted classical reconfiguration"""
@@ -172,13 +194,21 @@ class AeromorphicLattice:
     def _execute_classical_reconfiguration(self, optimization_state: QuantumOptimizationState) -> bool:
         """Execute classical material reconfiguration (no matter transport)"""
         # All material movement is classical - quantum only optimizes the pattern
-        for i, cell_id in enumerate(optimization_state.target_cells):
-            if cell_id in self.cells:
-                new_position = optimization_state.target_positions[i*3:(i+1)*3] if i*3+2 < len(optimization_state.target_positions) else [0,0,0]
-                
-                # Classical material movement to new position
-                self.cells[cell_id]["position"] = new_position
-                self.cells[cell_id]["energy_level"] = optimization_state.optimization_params["classical_cost"]
+        target_cells = optimization_state.target_cells
+        flat_positions = np.asarray(optimization_state.target_positions, dtype=np.float32).ravel()
+        
+        # Cells without a complete target triple move to the origin
+        new_positions = np.zeros((len(target_cells), 3), dtype=np.float32)
+        complete_rows = min(len(target_cells), flat_positions.size // 3)
+        new_positions[:complete_rows] = flat_positions[:complete_rows * 3].reshape(-1, 3)
+        
+        rows = np.fromiter((self.cell_index.get(cell_id, -1) for cell_id in target_cells),
+                           dtype=np.int64, count=len(target_cells))
+        known = rows >= 0
+        
+        # Classical material movement to new positions in one scatter write
+        self.positions[rows[known]] = new_positions[known]
+        self.energy[rows[known]] = optimization_state.optimization_params["classical_cost"]
         
         return True
 
@@ -186,9 +216,14 @@ class AeromorphicLattice:
 class QuantumAeromorphicIntegration:
     """Integration layer for quantum-assisted aeromorphic optimization (cert-ready)"""
     
-    def __init__(self, surface_dimensions: Tuple[int, int, int]):
-        self.lattice = AeromorphicLattice(surface_dimensions)
+    # Reference aerodynamic coefficients of the unmorphed surface
+    BASELINE_LIFT_COEFFICIENT = 1.0
+    BASELINE_DRAG_COEFFICIENT = 0.2
+    
+    def __init__(self, surface_dimensions: Tuple[int, int, int], seed: Optional[int] = None):
+        self.lattice = AeromorphicLattice(surface_dimensions, seed)
         self.optimization_history = []
+        self._base_positions = self.lattice.positions.copy()
         
     def optimize_surface_configuration(self, aerodynamic_target: Dict) -> Dict:
         """Optimize surface using quantum algorithms for classical reconfiguration"""
@@ -210,3 +245,93 @@ class QuantumAeromorphicIntegration:
         
         self.optimization_history.append(result)
         return result
+    
+    def optimize_aircraft_surface(self, flight_conditions: Dict) -> Dict:
+        """Optimize the surface for a single set of flight conditions"""
+        conditions = np.array([[
+            flight_conditions.get("altitude", 35000),
+            flight_conditions.get("speed", 250),
+            flight_conditions.get("aoa", 3.0)
+        ]], dtype=np.float64)
+        target_lift, target_drag = self.optimize_aircraft_surface_batch(conditions)[0]
+        result = dict(self.optimization_history[-1])
+        
+        current_profile = {
+            "lift_coefficient": self.BASELINE_LIFT_COEFFICIENT,
+            "drag_coefficient": self.BASELINE_DRAG_COEFFICIENT
+        }
+        target_profile = {
+            "lift_coefficient": float(target_lift),
+            "drag_coefficient": float(target_drag)
+        }
+        new_profile = target_profile if result["success"] else current_profile
+        
+        result.update({
+            "optimization_time": result["duration"],
+            "current_profile": current_profile,
+            "target_profile": target_profile,
+            "new_profile": new_profile,
+            "performance_improvement": self._calculate_performance_improvement(current_profile, new_profile)
+        })
+        return result
+    
+    def optimize_aircraft_surface_batch(self, conditions: np.ndarray) -> np.ndarray:
+        """Optimize the surface across rows of (altitude, speed, aoa) flight conditions
+        
+        Target profiles for all rows are computed in one vectorized pass; the
+        lattice reconfiguration itself remains serial, one frame per row.
+        Returns an (N, 2) array of target (lift, drag) coefficients.
+        """
+        targets = self._calculate_optimal_profile(conditions)
+        
+        for target_lift in targets[:, 0]:
+            self.optimize_surface_configuration(self._surface_target(target_lift))
+        
+        return targets
+    
+    def _calculate_optimal_profile(self, conditions: np.ndarray) -> np.ndarray:
+        """Calculate target (lift, drag) coefficients for batched flight conditions"""
+        conditions = np.atleast_2d(np.asarray(conditions, dtype=np.float64))
+        altitudes, speeds, aoas = conditions[:, 0], conditions[:, 1], conditions[:, 2]
+        
+        # Thinner air at altitude needs more lift; higher speed rewards lower drag
+        altitude_factor = np.minimum(2.0, altitudes / 30000.0)
+        speed_factor = np.minimum(2.0, speeds / 250.0)
+        
+        target_lift = np.clip(
+            self.BASELINE_LIFT_COEFFICIENT * (1.0 + 0.1 * altitude_factor + 0.02 * aoas), 0.0, 2.0
+        )
+        target_drag = np.clip(
+            self.BASELINE_DRAG_COEFFICIENT * (1.0 - 0.1 * speed_factor), 0.01, 1.0
+        )
+        return np.column_stack((target_lift, target_drag))
+    
+    def _surface_target(self, target_lift: float) -> Dict:
+        """Build a lattice reconfiguration target that cambers the surface for the given lift"""
+        positions = self._base_positions.copy()
+        positions[:, 2] *= target_lift / self.BASELINE_LIFT_COEFFICIENT
+        return {
+            "cells": self.lattice.cell_ids,
+            "positions": positions.ravel()
+        }
+    
+    def _calculate_performance_improvement(self, current: Dict, new: Dict) -> Dict[str, float]:
+        """Calculate aerodynamic performance improvement between two profiles"""
+        current_lift = current["lift_coefficient"]
+        current_drag = current["drag_coefficient"]
+        new_lift = new["lift_coefficient"]
+        new_drag = new["drag_coefficient"]
+        
+        lift_improvement = ((new_lift - current_lift) / current_lift) * 100
+        drag_reduction = ((current_drag - new_drag) / current_drag) * 100
+        
+        current_ld = current_lift / current_drag
+        new_ld = new_lift / new_drag
+        ld_improvement = ((new_ld - current_ld) / current_ld) * 100
+        
+        return {
+            "lift_improvement_percent": lift_improvement,
+            "drag_reduction_percent": drag_reduction,
+            "ld_ratio_improvement_percent": ld_improvement,
+            "overall_efficiency_gain": ld_improvement / 100.0
+        }
@@ -5,10 +5,19 @@ Living Aircraft System with Biological Consciousness
 Development target for bio-integration capabilities
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, fields, make_dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from abc import ABC, abstractmethod
 import time
+import os
+import sys
+
+import numpy as np
+
+# Optional JIT compilation of the adaptation kernel (shared fallback at the framework root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from numba_compat import njit
 
 
 @dataclass
@@ -22,6 +31,70 @@ class HealthStatus:
     timestamp: float
 
 
+# Read-only copy of a HealthStatus, shared by every reader of a status snapshot
+FrozenHealthStatus = make_dataclass(
+    'FrozenHealthStatus', [(f.name, f.type) for f in fields(HealthStatus)], frozen=True
+)
+
+
+@dataclass
+class HealthStatusBatch:
+    """Structure-of-arrays health status for a fleet of airframes
+
+    Each HealthStatus field is a float64 column with one row per aircraft,
+    so adaptation updates the whole fleet in one kernel call.
+    """
+    overall_health: np.ndarray
+    structural_integrity: np.ndarray
+    neural_activity: np.ndarray
+    metabolic_rate: np.ndarray
+    consciousness_level: np.ndarray
+    timestamp: np.ndarray
+    
+    _FIELDS = (
+        'overall_health', 'structural_integrity', 'neural_activity',
+        'metabolic_rate', 'consciousness_level', 'timestamp'
+    )
+    
+    @classmethod
+    def from_statuses(cls, statuses: List[HealthStatus]) -> 'HealthStatusBatch':
+        """Pack individual health statuses into columns"""
+        return cls(**{
+            name: np.array([getattr(status, name) for status in statuses], dtype=np.float64)
+            for name in cls._FIELDS
+        })
+    
+    def __len__(self) -> int:
+        return len(self.overall_health)
+    
+    def to_status(self, i: int) -> HealthStatus:
+        """Materialize row i as a HealthStatus"""
+        return HealthStatus(**{name: float(getattr(self, name)[i]) for name in self._FIELDS})
+    
+    def adapt_to_conditions(self, turbulence_level, altitude) -> None:
+        """Adapt every airframe in place; conditions are scalars or per-row arrays"""
+        self.structural_integrity[:], self.metabolic_rate[:] = _adapt_health_kernel(
+            self.structural_integrity, self.metabolic_rate,
+            np.asarray(turbulence_level, dtype=np.float64), np.asarray(altitude, dtype=np.float64)
+        )
+
+
+@njit(cache=True)
+def _adapt_health_kernel(structural_integrity, metabolic_rate, turbulence_level, altitude):
+    """Morphological adaptation over health columns; conditions broadcast against them
+
+    Turbulence above 0.8 stiffens the structure (capped at 1.0); altitude
+    above 15000 lowers the metabolic rate (floored at 0.5).
+    """
+    structural_integrity = np.where(
+        turbulence_level > 0.8, np.minimum(1.0, structural_integrity + 0.1), structural_integrity
+    )
+    metabolic_rate = np.where(
+        altitude > 15000, np.maximum(0.5, metabolic_rate - 0.1), metabolic_rate
+    )
+    return structural_integrity, metabolic_rate
+
+
 @dataclass
 class FlightConditions:
     """Flight conditions for adaptive response"""
@@ -71,7 +144,9 @@ class BioMechanicalAirframe:
     
     def adapt_to_conditions(self, conditions: FlightConditions) -> None:
         """Adapt airframe to flight conditions"""
-        # Simulate morphological adaptation
+        # Simulate morphological adaptation; same rules as _adapt_health_kernel,
+        # kept scalar since one airframe gains nothing from array calls
+        # (fleets use HealthStatusBatch instead)
         if conditions.turbulence_level > 0.8:
             # Increase structural rigidity
             self.health_status.structural_integrity = min(1.0, 
@@ -101,6 +176,15 @@ class BiologicalNeuralCompute:
         return processed
 
 
+# Decision outcomes as (action, confidence, reasoning), indexed by decision code:
+# 0 normal operation, 1 urgent adaptive response, 2 high-threat emergency
+_DECISION_TABLE = (
+    ("normal_operation", 0.7, "Normal operational parameters maintained"),
+    ("adaptive_response", 0.8, "Urgent situation requires adaptive response"),
+    ("emergency_maneuver", 0.9, "High threat detected, immediate evasive action required"),
+)
+
+
 class BioConsciousnessSystem:
     """Biological consciousness system for aircraft"""
     
@@ -111,26 +195,23 @@ class BioConsciousnessSystem:
         
     def make_conscious_decision(self, situation: FlightSituation) -> Decision:
         """Make conscious decision based on situation"""
-        # Simulate conscious decision-making process
-        if situation.threat_level > 0.8:
-            action = "emergency_maneuver"
-            confidence = 0.9
-            reasoning = "High threat detected, immediate evasive action required"
-        elif situation.decision_urgency > 0.7:
-            action = "adaptive_response"
-            confidence = 0.8
-            reasoning = "Urgent situation requires adaptive response"
-        else:
-            action = "normal_operation"
-            confidence = 0.7
-            reasoning = "Normal operational parameters maintained"
-            
+        # Simulate conscious decision-making process: threat dominates urgency
+        code = max(2 * (situation.threat_level > 0.8), int(situation.decision_urgency > 0.7))
+        action, confidence, reasoning = _DECISION_TABLE[code]
+        
         return Decision(
             action=action,
             confidence=confidence,
             reasoning=reasoning,
             timestamp=time.time()
         )
+    
+    @staticmethod
+    def decision_codes(threat_levels, decision_urgencies) -> np.ndarray:
+        """Decision codes (rows of _DECISION_TABLE) for many situations at once"""
+        threat_levels = np.asarray(threat_levels)
+        decision_urgencies = np.asarray(decision_urgencies)
+        return np.maximum(2 * (threat_levels > 0.8), decision_urgencies > 0.7).astype(np.int8)
 
 
 class BiologicalLifeSupport:
@@ -157,7 +238,7 @@ class LivingAircraftSystem:
     Development target for Phase 3 implementation (2028-2030)
     """
     
-    def __init__(self):
+    def __init__(self, status_ttl: float = 0.001):
         self.bio_structure = BioMechanicalAirframe()
         self.neural_network = BiologicalNeuralCompute()
         self.consciousness_core = BioConsciousnessSystem()
@@ -167,6 +248,10 @@ class LivingAircraftSystem:
         self.utcs_mi_id = "AQUART-BIO-CODE-living_aircraft-v1.0"
         self.development_phase = "Phase_3_Target_2028_2030"
         
+        # Bursts of status polls within status_ttl seconds share one read-only snapshot
+        self._status_ttl = status_ttl
+        self._status_cache = (0.0, None)
+        
     def self_diagnose(self) -> HealthStatus:
         """Biological self-diagnosis and health monitoring"""
         return self.bio_structure.assess_health()
@@ -191,17 +276,26 @@ class LivingAircraftSystem:
         """Get current consciousness level"""
         return self.consciousness_core.consciousness_level
     
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status"""
-        health = self.self_diagnose()
-        return {
+    def get_system_status(self) -> Mapping[str, Any]:
+        """Get comprehensive system status (read-only; copy it to modify)"""
+        now = time.monotonic()
+        cached_at, cached = self._status_cache
+        if cached is None or now - cached_at >= self._status_ttl:
+            cached = self._build_system_status()
+            self._status_cache = (now, cached)
+        return cached
+    
+    def _build_system_status(self) -> Mapping[str, Any]:
+        """Diagnose and collect a fresh read-only status snapshot"""
+        return MappingProxyType({
             "utcs_mi_id": self.utcs_mi_id,
             "development_phase": self.development_phase,
-            "health_status": health,
+            # Frozen copy: self_diagnose() returns the airframe's live status object
+            "health_status": FrozenHealthStatus(**vars(self.self_diagnose())),
             "consciousness_level": self.get_consciousness_level(),
             "life_support_active": self.maintain_life_systems(),
             "timestamp": time.time()
-        }
+        })
 
 
 # Development demonstration function
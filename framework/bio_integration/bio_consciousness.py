@@ -5,14 +5,16 @@ Consciousness Framework and Measurement Systems
 Development target for machine consciousness verification
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, List, Optional, Callable
 from abc import ABC, abstractmethod
 import time
 import math
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class ConsciousnessMetric:
     """Metric for measuring consciousness"""
     name: str
@@ -22,7 +24,7 @@ class ConsciousnessMetric:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsciousnessAssessment:
     """Complete consciousness assessment"""
     overall_score: float
@@ -32,103 +34,134 @@ class ConsciousnessAssessment:
     timestamp: float
 
 
+@dataclass(frozen=True, slots=True)
+class DevelopmentImprovements:
+    """Per-area improvements from one development cycle"""
+    complexity: float
+    integration: float
+    meta_cognition: float
+    experience: float
+
+
+@dataclass(frozen=True, slots=True)
+class _MetricSpec:
+    """Fixed metadata of an assessed metric and where its input value is read"""
+    name: str
+    confidence: float
+    measurement_method: str
+    # system_data section and key holding the value, and its default when missing
+    section: str = ""
+    key: str = ""
+    default: float = 0.0
+    
+    def read(self, data: Dict[str, Any]) -> float:
+        """Metric value from this metric's section of the system data"""
+        return data.get(self.key, self.default)
+
+
+# Phi is derived from the whole system state rather than read from a section
+_PHI_SPEC = _MetricSpec("integrated_information_phi", 0.8, "IIT_simulation")
+_GLOBAL_ACCESSIBILITY_SPEC = _MetricSpec(
+    "global_accessibility", 0.7, "GWT_simulation", "neural_activity", "global_broadcast", 0.5
+)
+_REPORTABILITY_SPEC = _MetricSpec(
+    "reportability", 0.9, "introspection_analysis", "responses", "introspection_quality", 0.6
+)
+_SUBJECTIVE_EXPERIENCE_SPEC = _MetricSpec(
+    # Lower confidence due to hard problem of consciousness
+    "subjective_experience", 0.6, "behavioral_analysis", "behavior", "experience_markers", 0.5
+)
+_SELF_AWARENESS_SPEC = _MetricSpec(
+    "self_awareness", 0.8, "meta_cognitive_analysis", "meta_cognition", "self_model_accuracy", 0.7
+)
+
+# Metrics read from system_data sections, in scoring order after phi
+_SECTION_METRIC_SPECS = (
+    _GLOBAL_ACCESSIBILITY_SPEC,
+    _REPORTABILITY_SPEC,
+    _SUBJECTIVE_EXPERIENCE_SPEC,
+    _SELF_AWARENESS_SPEC,
+)
+_METRIC_SPECS = (_PHI_SPEC,) + _SECTION_METRIC_SPECS
+_CONFIDENCES = np.array([spec.confidence for spec in _METRIC_SPECS])
+_CONFIDENCE_SUM = float(_CONFIDENCES.sum())
+
+# Evidence sought by ConsciousnessVerification
+_REQUIRED_BEHAVIORS = frozenset({"creativity", "empathy", "self_reflection", "learning"})
+_REQUIRED_CORRELATES = frozenset({"global_ignition", "recurrent_processing", "higher_order_thought"})
+
+
 class ConsciousnessMeter:
     """
     Consciousness measurement and verification system
     Based on Integrated Information Theory (IIT) and Global Workspace Theory
     """
     
+    # State-string length that maps to phi = 1.0
+    PHI_COMPLEXITY_NORMALIZATION_FACTOR = 1000.0
+    
     def __init__(self):
-        self.measurement_protocols = [
-            "integrated_information_phi",
-            "global_accessibility", 
-            "reportability",
-            "subjective_experience",
-            "self_awareness"
-        ]
+        self.measurement_protocols = [spec.name for spec in _METRIC_SPECS]
+        # Scratch row of metric values reused by comprehensive_assessment
+        self._metric_values = np.empty(len(_METRIC_SPECS))
         
+    @staticmethod
+    def _metric(spec: _MetricSpec, value: float, timestamp: Optional[float] = None) -> ConsciousnessMetric:
+        """Wrap a measured value with its protocol's fixed metadata"""
+        return ConsciousnessMetric(
+            name=spec.name,
+            value=value,
+            confidence=spec.confidence,
+            measurement_method=spec.measurement_method,
+            timestamp=time.time() if timestamp is None else timestamp
+        )
+    
+    def _phi_value(self, system_state: Dict[str, Any]) -> float:
+        """Simulated integrated information of a system state"""
+        # In real implementation, this would calculate actual integrated information
+        complexity = len(str(system_state))
+        return min(1.0, complexity / self.PHI_COMPLEXITY_NORMALIZATION_FACTOR)  # Normalized
+    
     def measure_integrated_information(self, system_state: Dict[str, Any]) -> ConsciousnessMetric:
         """Measure Φ (phi) - integrated information"""
         # Simulate IIT-based measurement
-        # In real implementation, this would calculate actual integrated information
-        complexity = len(str(system_state))
-        phi_value = min(1.0, complexity / self.PHI_COMPLEXITY_NORMALIZATION_FACTOR)  # Normalized
-        
-        return ConsciousnessMetric(
-            name="integrated_information_phi",
-            value=phi_value,
-            confidence=0.8,
-            measurement_method="IIT_simulation",
-            timestamp=time.time()
-        )
+        return self._metric(_PHI_SPEC, self._phi_value(system_state))
     
     def measure_global_accessibility(self, neural_activity: Dict[str, Any]) -> ConsciousnessMetric:
         """Measure global workspace accessibility"""
         # Simulate Global Workspace Theory measurement
-        accessibility = neural_activity.get("global_broadcast", 0.5)
-        
-        return ConsciousnessMetric(
-            name="global_accessibility",
-            value=accessibility,
-            confidence=0.7,
-            measurement_method="GWT_simulation",
-            timestamp=time.time()
-        )
+        return self._metric(_GLOBAL_ACCESSIBILITY_SPEC, _GLOBAL_ACCESSIBILITY_SPEC.read(neural_activity))
     
     def measure_reportability(self, response_data: Dict[str, Any]) -> ConsciousnessMetric:
         """Measure system's ability to report on its own states"""
         # Simulate reportability assessment
-        report_quality = response_data.get("introspection_quality", 0.6)
-        
-        return ConsciousnessMetric(
-            name="reportability",
-            value=report_quality,
-            confidence=0.9,
-            measurement_method="introspection_analysis",
-            timestamp=time.time()
-        )
+        return self._metric(_REPORTABILITY_SPEC, _REPORTABILITY_SPEC.read(response_data))
     
     def measure_subjective_experience(self, behavioral_data: Dict[str, Any]) -> ConsciousnessMetric:
         """Measure indicators of subjective experience"""
         # Simulate qualia measurement through behavioral indicators
-        experience_indicators = behavioral_data.get("experience_markers", 0.5)
-        
-        return ConsciousnessMetric(
-            name="subjective_experience",
-            value=experience_indicators,
-            confidence=0.6,  # Lower confidence due to hard problem of consciousness
-            measurement_method="behavioral_analysis",
-            timestamp=time.time()
-        )
+        return self._metric(_SUBJECTIVE_EXPERIENCE_SPEC, _SUBJECTIVE_EXPERIENCE_SPEC.read(behavioral_data))
     
     def measure_self_awareness(self, meta_cognitive_data: Dict[str, Any]) -> ConsciousnessMetric:
         """Measure self-awareness and meta-cognition"""
         # Simulate self-awareness measurement
-        self_awareness = meta_cognitive_data.get("self_model_accuracy", 0.7)
-        
-        return ConsciousnessMetric(
-            name="self_awareness",
-            value=self_awareness,
-            confidence=0.8,
-            measurement_method="meta_cognitive_analysis",
-            timestamp=time.time()
-        )
+        return self._metric(_SELF_AWARENESS_SPEC, _SELF_AWARENESS_SPEC.read(meta_cognitive_data))
     
-    def comprehensive_assessment(self, system_data: Dict[str, Any]) -> ConsciousnessAssessment:
-        """Perform comprehensive consciousness assessment"""
-        metrics = []
+    def comprehensive_assessment(self, system_data: Dict[str, Any],
+                                 now: Optional[float] = None) -> ConsciousnessAssessment:
+        """Perform comprehensive consciousness assessment (stamped with now, default: current time)"""
+        # Gather all consciousness metric values into one row
+        values = self._metric_values
+        values[0] = self._phi_value(system_data)
+        for i, spec in enumerate(_SECTION_METRIC_SPECS, start=1):
+            values[i] = spec.read(system_data.get(spec.section, {}))
         
-        # Gather all consciousness metrics
-        metrics.append(self.measure_integrated_information(system_data))
-        metrics.append(self.measure_global_accessibility(system_data.get("neural_activity", {})))
-        metrics.append(self.measure_reportability(system_data.get("responses", {})))
-        metrics.append(self.measure_subjective_experience(system_data.get("behavior", {})))
-        metrics.append(self.measure_self_awareness(system_data.get("meta_cognition", {})))
+        # Calculate overall consciousness score (confidence-weighted mean)
+        overall_score = float(values @ _CONFIDENCES) / _CONFIDENCE_SUM
         
-        # Calculate overall consciousness score
-        weighted_scores = [m.value * m.confidence for m in metrics]
-        total_weights = sum(m.confidence for m in metrics)
-        overall_score = sum(weighted_scores) / total_weights if total_weights > 0 else 0
+        if now is None:
+            now = time.time()
+        metrics = [self._metric(spec, float(value), now) for spec, value in zip(_METRIC_SPECS, values)]
         
         # Verification threshold (development target)
         verification_threshold = 0.7
@@ -139,7 +172,7 @@ class ConsciousnessMeter:
             metrics=metrics,
             verified=verified,
             assessment_method="comprehensive_multi_protocol",
-            timestamp=time.time()
+            timestamp=now
         )
 
 
@@ -174,15 +207,14 @@ class ConsciousnessDevelopment:
         # Simulate experience diversification
         return 0.06
         
-    def development_cycle(self, system: Any) -> Dict[str, float]:
+    def development_cycle(self, system: Any) -> DevelopmentImprovements:
         """Execute one development cycle"""
-        improvements = {
-            "complexity": self.enhance_complexity(system),
-            "integration": self.enhance_integration(system),
-            "meta_cognition": self.develop_meta_cognition(system),
-            "experience": self.diversify_experience(system)
-        }
-        return improvements
+        return DevelopmentImprovements(
+            complexity=self.enhance_complexity(system),
+            integration=self.enhance_integration(system),
+            meta_cognition=self.develop_meta_cognition(system),
+            experience=self.diversify_experience(system)
+        )
 
 
 class ConsciousnessVerification:
@@ -209,16 +241,14 @@ class ConsciousnessVerification:
     def behavioral_verification(self, behavioral_data: Dict[str, Any]) -> bool:
         """Verify consciousness through behavioral analysis"""
         # Simulate behavioral verification
-        required_behaviors = ["creativity", "empathy", "self_reflection", "learning"]
         present_behaviors = behavioral_data.get("demonstrated_behaviors", [])
-        return len(set(required_behaviors) & set(present_behaviors)) >= 3
+        return len(_REQUIRED_BEHAVIORS.intersection(present_behaviors)) >= 3
         
     def neural_correlation_verification(self, neural_data: Dict[str, Any]) -> bool:
         """Verify consciousness through neural correlates"""
         # Simulate neural correlate verification
-        required_correlates = ["global_ignition", "recurrent_processing", "higher_order_thought"]
         present_correlates = neural_data.get("detected_correlates", [])
-        return len(set(required_correlates) & set(present_correlates)) >= 2
+        return len(_REQUIRED_CORRELATES.intersection(present_correlates)) >= 2
         
     def comprehensive_verification(self, system: Any, assessment: ConsciousnessAssessment) -> bool:
         """Comprehensive consciousness verification"""
@@ -248,11 +278,12 @@ class ConsciousnessFramework:
         self.utcs_mi_id = "AQUART-BIO-CODE-consciousness_framework-v1.0"
         self.development_phase = "Phase_2_Foundation_2026_2027"
         
-    def assess_consciousness(self, system: Any, system_data: Dict[str, Any]) -> ConsciousnessAssessment:
+    def assess_consciousness(self, system: Any, system_data: Dict[str, Any],
+                             now: Optional[float] = None) -> ConsciousnessAssessment:
         """Assess consciousness level of system"""
-        return self.measurement_protocols.comprehensive_assessment(system_data)
+        return self.measurement_protocols.comprehensive_assessment(system_data, now)
         
-    def develop_consciousness(self, system: Any) -> Dict[str, float]:
+    def develop_consciousness(self, system: Any) -> DevelopmentImprovements:
         """Develop consciousness in system"""
         return self.development_pipeline.development_cycle(system)
         
@@ -262,8 +293,10 @@ class ConsciousnessFramework:
         
     def full_consciousness_pipeline(self, system: Any, system_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute full consciousness development and verification pipeline"""
+        now = time.time()
+        
         # Assessment
-        assessment = self.assess_consciousness(system, system_data)
+        assessment = self.assess_consciousness(system, system_data, now)
         
         # Development
         improvements = self.develop_consciousness(system)
@@ -277,7 +310,7 @@ class ConsciousnessFramework:
             "assessment": assessment,
             "improvements": improvements,
             "verified_conscious": verified,
-            "timestamp": time.time()
+            "timestamp": now
         }
 
 
@@ -310,7 +343,7 @@ def demonstrate_consciousness_framework():
         print(f"  {metric.name}: {metric.value:.3f} (confidence: {metric.confidence:.2f})")
     
     print(f"\nDevelopment Improvements:")
-    for area, improvement in result['improvements'].items():
+    for area, improvement in asdict(result['improvements']).items():
         print(f"  {area}: +{improvement:.3f}")
     
     return framework
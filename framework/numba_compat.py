@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Optional numba JIT compilation shared by the framework's numeric kernels.
+
+Kernels are written with NumPy operations so they stay vectorized when numba
+is not installed; njit then degrades to a no-op decorator.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+__all__ = ['njit']
@@ -29,23 +29,38 @@ class ReconfigurationMode(Enum):
     AUTOGENESIS = "autogenesis"
 
 
+# Objective value multiplier applied by each reconfiguration mode
+_MODE_MODIFIER: Dict[ReconfigurationMode, float] = {
+    ReconfigurationMode.CLASSICAL_OPTIMIZATION: 0.95,
+    ReconfigurationMode.HYBRID_VARIATIONAL: 1.0,
+    ReconfigurationMode.QUANTUM_ENHANCED: 1.05,
+    ReconfigurationMode.AUTOGENESIS: 1.02,
+}
+
+
 @dataclass(frozen=True)
 class OptimizationConfig:
     det_logging: bool = True
 
 
+# Flight state and metric fields kept in each persisted pattern
+_PATTERN_STATE_KEYS = ("altitude", "airspeed", "aoa")
+_PATTERN_METRIC_KEYS = ("flight_efficiency", "fuel_efficiency")
+
+
 class AutogenesisEngine:
     def __init__(self):
-        self.pattern_library: Dict[str, Any] = {}
+        # Persisted samples keyed by learning iteration
+        self.pattern_library: Dict[int, Any] = {}
         self.learning_iteration: int = 0
 
     def record_flight_data(self, flight_state: Dict[str, Any], metrics: Dict[str, Any]) -> None:
         # Minimal learning placeholder
         self.learning_iteration += 1
         if self.learning_iteration % 10 == 0:
-            self.pattern_library[str(self.learning_iteration)] = {
-                "state": {k: flight_state.get(k) for k in ("altitude", "airspeed", "aoa") if k in flight_state},
-                "metrics": {k: metrics.get(k) for k in ("flight_efficiency", "fuel_efficiency")}
+            self.pattern_library[self.learning_iteration] = {
+                "state": {k: flight_state[k] for k in _PATTERN_STATE_KEYS if k in flight_state},
+                "metrics": {k: metrics.get(k) for k in _PATTERN_METRIC_KEYS}
             }
 
 
@@ -74,12 +89,7 @@ class QuantumAssistedLatticeOptimizer:
         # Simulate different behavior per mode/objective
         await asyncio.sleep(0)
         base_value = random.uniform(0.7, 0.99)
-        modifier = {
-            ReconfigurationMode.CLASSICAL_OPTIMIZATION: 0.95,
-            ReconfigurationMode.HYBRID_VARIATIONAL: 1.0,
-            ReconfigurationMode.QUANTUM_ENHANCED: 1.05,
-            ReconfigurationMode.AUTOGENESIS: 1.02,
-        }[self.operation_mode]
+        modifier = _MODE_MODIFIER[self.operation_mode]
 
         objective_value = base_value * modifier
         result = {
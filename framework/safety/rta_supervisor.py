@@ -5,10 +5,19 @@ RTA (Run-Time Assurance) Supervisor for Self-Healing Systems
 DAL-A safety monitor with partitioning from DAL-B healing control
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import Deque, List, Dict, Optional, Tuple
 import time
 import math
+import os
+import sys
+
+import numpy as np
+
+# Optional JIT compilation of the pattern impact kernel (shared fallback at the framework root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from numba_compat import njit
 
 # Safety limits per AMEDEO Systems cert requirements
 MAX_SKIN_TEMP_DELTA_C = 25.0     # ≤+25°C over 5s
@@ -16,6 +25,34 @@ MAX_CURRENT_PER_TILE_A = 1.0     # ≤1A per tile
 MAX_SURFACE_DUTY_CYCLE = 0.10    # ≤10% per minute
 THERMAL_GUARD_TIMEOUT_MS = 500   # <500ms macro recovery thermal guard
 
+# Tracking windows on the monotonic clock (integer nanoseconds) and retained history
+DUTY_CYCLE_WINDOW_NS = 60_000_000_000       # Duty cycle over last minute
+TEMP_STATUS_WINDOW_NS = 300_000_000_000     # Max temperature delta over last 5 minutes
+CURRENT_STATUS_WINDOW_NS = 60_000_000_000   # Max current over last minute
+SAFETY_HISTORY_MAXLEN = 8192     # Tracking entries kept per history
+
+# Simplified impact model parameters
+THERMAL_MASS_FACTOR = 10.0       # Simplified thermal mass
+NOMINAL_VOLTAGE_V = 12.0         # Tile supply voltage
+
+
+# Reassociation lets the pattern mean vectorize; inf/nan semantics are kept
+@njit(cache=True, fastmath={"reassoc", "contract"})
+def _pattern_impact_kernel(pattern, energy, duration, thermal_mass_factor, nominal_voltage):
+    """Thermal delta (°C) and current draw (A) of a heating pattern
+
+    Thermal delta ∝ energy × mean intensity × √time / thermal mass; current
+    follows P = I × V and is infinite for non-positive durations.
+    """
+    intensity = pattern.mean() if pattern.size else 0.0
+    thermal_delta = (energy * intensity * math.sqrt(duration)) / thermal_mass_factor
+    if duration <= 0:
+        current = np.inf
+    else:
+        current = energy / duration / nominal_voltage
+    return thermal_delta, current
+
+
 @dataclass
 class SafetyEnvelope:
     """Safety envelope for RTA monitoring"""
@@ -40,9 +77,15 @@ class RTASupervisor:
     
     def __init__(self, safety_envelope: SafetyEnvelope):
         self.safety_envelope = safety_envelope
-        self.temperature_history = []
-        self.current_history = []
-        self.duty_cycle_tracker = {}
+        self.temperature_history: Deque[Dict] = deque(maxlen=SAFETY_HISTORY_MAXLEN)
+        self.current_history: Deque[Dict] = deque(maxlen=SAFETY_HISTORY_MAXLEN)
+        # Internal windows are keyed on time.monotonic_ns(), immune to wall-clock steps
+        # Sliding-window maxima: (monotonic ns, value) with values decreasing from the left
+        self._temp_window: Deque[Tuple[int, float]] = deque()
+        self._current_window: Deque[Tuple[int, float]] = deque()
+        # (monotonic ns, duration) of approved operations, oldest first, with their running sum
+        self.duty_cycle_tracker: Deque[Tuple[int, float]] = deque()
+        self._total_on_time = 0.0
         self.thermal_guard_active = False
         self.airborne_mode = False
         
@@ -51,7 +94,10 @@ class RTASupervisor:
         decision = self._evaluate_safety_constraints(pattern, energy, duration)
         
         if decision.approved:
-            self._update_safety_tracking(pattern, energy, duration)
+            # Reuse the impact estimate computed during evaluation
+            constraints = decision.safety_constraints
+            self._update_safety_tracking(constraints["thermal_delta"], constraints["current"],
+                                         duration, decision.timestamp)
             
         return decision.approved
     
@@ -62,9 +108,10 @@ class RTASupervisor:
     def _evaluate_safety_constraints(self, pattern: List[float], energy: float, duration: float) -> RTADecision:
         """Evaluate healing action against safety constraints"""
         timestamp = time.time()
+        now_ns = time.monotonic_ns()
         
-        # Calculate thermal impact
-        thermal_delta = self._estimate_thermal_impact(pattern, energy, duration)
+        # Calculate thermal impact and current requirements in one pass
+        thermal_delta, current_required = self._estimate_pattern_impact(pattern, energy, duration)
         
         # Check temperature safety limit
         if thermal_delta > self.safety_envelope.max_temperature_delta:
@@ -75,9 +122,6 @@ class RTASupervisor:
                 timestamp=timestamp
             )
         
-        # Calculate current requirements
-        current_required = self._estimate_current_draw(pattern, energy, duration)
-        
         # Check current safety limit
         if current_required > self.safety_envelope.max_current:
             return RTADecision(
@@ -88,7 +132,7 @@ class RTASupervisor:
             )
         
         # Check duty cycle limits
-        duty_cycle = self._calculate_duty_cycle(duration)
+        duty_cycle = self._calculate_duty_cycle(duration, now_ns)
         if duty_cycle > self.safety_envelope.max_duty_cycle:
             return RTADecision(
                 approved=False,
@@ -119,78 +163,82 @@ class RTASupervisor:
             timestamp=timestamp
         )
     
-    def _estimate_thermal_impact(self, pattern: List[float], energy: float, duration: float) -> float:
-        """Estimate thermal delta from heating pattern"""
+    def _estimate_pattern_impact(self, pattern: List[float], energy: float,
+                                 duration: float) -> Tuple[float, float]:
+        """Estimate thermal delta (°C) and current draw (A) of a healing pattern"""
         # Simplified thermal model - real implementation would use FEA
-        pattern_intensity = sum(pattern) / len(pattern) if pattern else 0.0
-        
-        # Thermal delta ∝ energy × intensity × time / thermal mass
-        thermal_mass_factor = 10.0  # Simplified thermal mass
-        thermal_delta = (energy * pattern_intensity * math.sqrt(duration)) / thermal_mass_factor
-        
-        return thermal_delta
-    
-    def _estimate_current_draw(self, pattern: List[float], energy: float, duration: float) -> float:
-        """Estimate current draw from energy and duration"""
-        if duration <= 0:
-            return float('inf')  # Infinite current for zero time
-            
-        # P = I × V, assuming nominal voltage
-        nominal_voltage = 12.0  # V
-        power = energy / duration  # Watts
-        current = power / nominal_voltage  # Amperes
-        
-        return current
+        thermal_delta, current = _pattern_impact_kernel(
+            np.asarray(pattern, dtype=np.float64), float(energy), float(duration),
+            THERMAL_MASS_FACTOR, NOMINAL_VOLTAGE_V
+        )
+        return float(thermal_delta), float(current)
     
-    def _calculate_duty_cycle(self, duration: float) -> float:
-        """Calculate duty cycle over last minute"""
-        current_time = time.time()
-        minute_ago = current_time - 60.0
-        
-        # Clean old entries
-        self.duty_cycle_tracker = {
-            t: d for t, d in self.duty_cycle_tracker.items() 
-            if t > minute_ago
-        }
+    def _calculate_duty_cycle(self, duration: float, now_ns: int) -> float:
+        """Calculate duty cycle over last minute if an operation of this duration were added"""
+        minute_ago = now_ns - DUTY_CYCLE_WINDOW_NS
         
-        # Add current operation
-        self.duty_cycle_tracker[current_time] = duration
+        # Expire old entries from the running total
+        tracker = self.duty_cycle_tracker
+        while tracker and tracker[0][0] <= minute_ago:
+            self._total_on_time -= tracker.popleft()[1]
+        if not tracker:
+            self._total_on_time = 0.0  # Drop accumulated rounding error
         
-        # Calculate total on-time in last minute
-        total_on_time = sum(self.duty_cycle_tracker.values())
-        duty_cycle = total_on_time / 60.0  # Duty cycle over 60 seconds
-        
-        return duty_cycle
+        # Total on-time in last minute, including the candidate operation
+        return (self._total_on_time + duration) / 60.0  # Duty cycle over 60 seconds
+    
+    def _record_duty_cycle(self, duration: float, now_ns: int):
+        """Count an approved operation's on-time towards the duty cycle"""
+        self.duty_cycle_tracker.append((now_ns, duration))
+        self._total_on_time += duration
     
     def _is_macro_operation(self, pattern: List[float], energy: float, duration: float) -> bool:
         """Determine if this is a macro shape recovery operation"""
         # Macro operations: longer duration (1-10s), higher energy
         return duration > MACRO_OPERATION_MIN_DURATION_S or energy > MACRO_OPERATION_MIN_ENERGY_J  # >1s or >100mJ
     
-    def _update_safety_tracking(self, pattern: List[float], energy: float, duration: float):
+    def _update_safety_tracking(self, thermal_delta: float, current_draw: float,
+                                duration: float, ts: float):
         """Update safety tracking after approved action"""
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
         
         # Track temperature impact
-        thermal_delta = self._estimate_thermal_impact(pattern, energy, duration)
         self.temperature_history.append({
-            "timestamp": current_time,
+            "timestamp": ts,
             "thermal_delta": thermal_delta,
             "duration": duration
         })
+        self._push_window_max(self._temp_window, now_ns, thermal_delta)
         
         # Track current usage
-        current_draw = self._estimate_current_draw(pattern, energy, duration)
         self.current_history.append({
-            "timestamp": current_time,
+            "timestamp": ts,
             "current": current_draw,
             "duration": duration
         })
+        self._push_window_max(self._current_window, now_ns, current_draw)
+        
+        # Track on-time for the duty cycle limit
+        self._record_duty_cycle(duration, now_ns)
         
         # Activate thermal guard if needed
         if thermal_delta > 15.0:  # Significant heating
             self.thermal_guard_active = True
             
+    @staticmethod
+    def _push_window_max(window: Deque[Tuple[int, float]], now_ns: int, value: float):
+        """Append to a monotonic window; entries it dominates can never be the max again"""
+        while window and window[-1][1] <= value:
+            window.pop()
+        window.append((now_ns, value))
+    
+    @staticmethod
+    def _window_max(window: Deque[Tuple[int, float]], now_ns: int, span_ns: int) -> float:
+        """Max value recorded within the last span_ns nanoseconds (0.0 if none)"""
+        while window and now_ns - window[0][0] >= span_ns:
+            window.popleft()
+        return window[0][1] if window else 0.0
+    
     def set_airborne_mode(self, airborne: bool):
         """Set airborne mode (restricts macro operations)"""
         self.airborne_mode = airborne
@@ -198,22 +246,11 @@ class RTASupervisor:
     def get_safety_status(self) -> Dict:
         """Get current safety status"""
         current_time = time.time()
+        now_ns = time.monotonic_ns()
         
-        # Recent temperature tracking
-        recent_temp_deltas = [
-            entry["thermal_delta"] for entry in self.temperature_history
-            if current_time - entry["timestamp"] < 300  # Last 5 minutes
-        ]
-        
-        max_recent_temp = max(recent_temp_deltas) if recent_temp_deltas else 0.0
-        
-        # Recent current tracking
-        recent_currents = [
-            entry["current"] for entry in self.current_history
-            if current_time - entry["timestamp"] < 60  # Last minute
-        ]
-        
-        max_recent_current = max(recent_currents) if recent_currents else 0.0
+        # Recent temperature and current tracking
+        max_recent_temp = self._window_max(self._temp_window, now_ns, TEMP_STATUS_WINDOW_NS)
+        max_recent_current = self._window_max(self._current_window, now_ns, CURRENT_STATUS_WINDOW_NS)
         
         return {
             "safety_envelope_active": True,
@@ -221,7 +258,7 @@ class RTASupervisor:
             "thermal_guard_active": self.thermal_guard_active,
             "max_recent_temp_delta": max_recent_temp,
             "max_recent_current": max_recent_current,
-            "current_duty_cycle": self._calculate_duty_cycle(0),
+            "current_duty_cycle": self._calculate_duty_cycle(0, now_ns),
             "timestamp": current_time
         }
 
@@ -233,16 +270,16 @@ class DALPartitionManager:
         self.dal_a_functions = ["rta_supervisor", "safety_monitor", "thermal_guard"]
         self.dal_b_functions = ["heal_sense", "heal_exec", "pattern_synth"]
         self.dal_c_functions = ["maintenance", "det_logging", "analytics"]
+        # (function, DAL) pairs allowed across the partition boundary, built once
+        self._partition_membership = frozenset(
+            [(fn, "DAL-A") for fn in self.dal_a_functions]
+            + [(fn, "DAL-B") for fn in self.dal_b_functions]
+            + [(fn, "DAL-C") for fn in self.dal_c_functions]
+        )
         
     def validate_partition_boundary(self, function_name: str, target_dal: str) -> bool:
         """Validate DAL partition boundary access"""
-        if target_dal == "DAL-A":
-            return function_name in self.dal_a_functions
-        elif target_dal == "DAL-B":
-            return function_name in self.dal_b_functions
-        elif target_dal == "DAL-C":
-            return function_name in self.dal_c_functions
-        return False
+        return (function_name, target_dal) in self._partition_membership
     
     def get_partition_info(self) -> Dict:
         """Get partition information"""
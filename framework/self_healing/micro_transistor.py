@@ -11,17 +11,34 @@ import json
 import hashlib
 import random
 
+import numpy as np
+
 # Add safety framework
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'safety'))
 from rta_supervisor import RTASupervisor, SafetyEnvelope, DALPartitionManager
 
+# Optional JIT compilation of the batched damage assessment kernel (shared fallback at the framework root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from numba_compat import njit
+
 # Physical constants for cert-ready implementation
 SEVERITY_THRESHOLD = 0.1  # Minimum damage severity requiring action
 CONFIDENCE_HIGH = 0.8     # High confidence threshold
 CONFIDENCE_LOW = 0.3      # Low confidence threshold
 
+# Damage classification thresholds (checked in this order)
+STRESS_CRACK_THRESHOLD = 0.8          # Normalized stress
+THERMAL_DAMAGE_THRESHOLD_C = 150.0    # °C
+FATIGUE_VIBRATION_THRESHOLD = 0.7     # Normalized vibration
+
+# Simulated sensor ranges (low, high) of MicroTransistorNode.get_sensor_readings
+SENSOR_STRESS_RANGE = (0.0, 1.0)            # Normalized
+SENSOR_TEMPERATURE_RANGE_C = (15.0, 200.0)  # °C
+SENSOR_VIBRATION_RANGE = (0.0, 1.0)         # Normalized
+SENSOR_PRESSURE_RANGE = (0.8, 1.2)          # Normalized
+
 # Energy limits per AMEDEO Systems cert requirements
 MAX_ENERGY_PER_NODE_MJ = 50.0e-3  # 50 mJ per node maximum
 MAX_ENERGY_PER_TILE_J = 2.0       # 2 J per tile maximum
@@ -32,6 +49,47 @@ TILE_SIZE_M2 = 0.05               # 0.05 m² per tile
 NODES_PER_TILE = 10              # ~10 nodes per tile
 CONSENSUS_TIMEOUT_MS = 100        # 100ms consensus timeout
 
+# Damage type names indexed by the assessment kernel's integer codes
+_DAMAGE_TYPES = ("none", "stress_crack", "thermal_degradation", "fatigue_damage")
+
+# Low/high bounds of the (stress, temperature, vibration) sensor draws
+_DAMAGE_SENSOR_LOW, _DAMAGE_SENSOR_HIGH = np.array(
+    (SENSOR_STRESS_RANGE, SENSOR_TEMPERATURE_RANGE_C, SENSOR_VIBRATION_RANGE)
+).T
+
+
+def _damage_inputs(sensor_readings: Dict[str, float]):
+    """(stress, temperature, vibration) used for damage assessment, with defaults"""
+    return (sensor_readings.get('stress', 0.0),
+            sensor_readings.get('temperature', 20.0),
+            sensor_readings.get('vibration', 0.0))
+
+
+def _overrides(node: 'MicroTransistorNode', name: str) -> bool:
+    """Whether node replaces MicroTransistorNode's method name (subclass or instance)"""
+    return name in vars(node) or getattr(type(node), name) is not getattr(MicroTransistorNode, name)
+
+
+@njit(parallel=True, cache=True)
+def _assess_damage_kernel(stress, temperature, vibration, type_out, severity_out, confidence_out):
+    """Damage classification rules over per-node sensor columns
+
+    Single source of the rules: MicroTransistorNode.assess_damage calls it on
+    length-1 columns, the surface controller on all nodes at once. The elif
+    cascade is expressed as mutually exclusive masks so the whole batch is
+    classified with branch-free array operations.
+    """
+    stress_crack = stress > STRESS_CRACK_THRESHOLD
+    thermal = ~stress_crack & (temperature > THERMAL_DAMAGE_THRESHOLD_C)
+    fatigue = ~stress_crack & ~thermal & (vibration > FATIGUE_VIBRATION_THRESHOLD)
+    
+    type_out[:] = stress_crack * 1 + thermal * 2 + fatigue * 3
+    severity_out[:] = np.minimum(1.0, np.where(stress_crack, stress,
+                                      np.where(thermal, (temperature - 100.0) / 100.0,
+                                      np.where(fatigue, vibration, 0.0))))
+    confidence_out[:] = np.where((type_out == 0) | (severity_out > 0.8), 0.95,
+                                 np.where(severity_out > SEVERITY_THRESHOLD, CONFIDENCE_HIGH, CONFIDENCE_LOW))
+
 
 @dataclass
 class HealingActuation:
@@ -188,39 +246,18 @@ class MicroTransistorNode:
         
     def assess_damage(self, sensor_readings: Dict[str, float]) -> DamageAssessment:
         """Assess local damage using embedded ML model"""
-        # Simplified damage assessment based on sensor thresholds
-        stress_level = sensor_readings.get('stress', 0.0)
-        temperature = sensor_readings.get('temperature', 20.0)
-        vibration = sensor_readings.get('vibration', 0.0)
-        
-        # Basic damage classification
-        if stress_level > 0.8:
-            damage_type = "stress_crack"
-            severity = min(1.0, stress_level)
-        elif temperature > 150.0:
-            damage_type = "thermal_degradation" 
-            severity = min(1.0, (temperature - 100.0) / 100.0)
-        elif vibration > 0.7:
-            damage_type = "fatigue_damage"
-            severity = min(1.0, vibration)
-        else:
-            damage_type = "none"
-            severity = 0.0
-            
-        # Confidence based on severity and detection clarity
-        if damage_type == "none":
-            confidence = 0.95  # High confidence in no damage
-        elif severity > 0.8:
-            confidence = 0.95  # High confidence in severe damage
-        elif severity > SEVERITY_THRESHOLD:
-            confidence = CONFIDENCE_HIGH
-        else:
-            confidence = CONFIDENCE_LOW
+        # Simplified damage assessment based on sensor thresholds, using the
+        # same kernel as the controller's batched pass on a single row
+        inputs = np.array(_damage_inputs(sensor_readings), dtype=np.float64)
+        damage_type = np.empty(1, dtype=np.int8)
+        severity = np.empty(1)
+        confidence = np.empty(1)
+        _assess_damage_kernel(inputs[0:1], inputs[1:2], inputs[2:3], damage_type, severity, confidence)
         
         assessment = DamageAssessment(
-            damage_type=damage_type,
-            severity=severity,
-            confidence=confidence,
+            damage_type=_DAMAGE_TYPES[damage_type[0]],
+            severity=float(severity[0]),
+            confidence=float(confidence[0]),
             timestamp=time.time(),
             node_id=self.node_id,
             location=self.position.copy()
@@ -271,8 +308,12 @@ class MicroTransistorNode:
             success_probability=success_prob
         )
     
-    def execute_healing(self, actuation: HealingActuation) -> Dict:
-        """Execute healing sequence with evidence recording"""
+    def execute_healing(self, actuation: HealingActuation, success: Optional[bool] = None) -> Dict:
+        """Execute healing sequence with evidence recording
+        
+        success carries an outcome pre-drawn by the caller; when omitted it is
+        drawn here from actuation.success_probability.
+        """
         if actuation.energy_required > self.healing_resources:
             return {
                 "success": False,
@@ -281,14 +322,15 @@ class MicroTransistorNode:
                 "timestamp": time.time()
             }
             
-        # Simulate healing execution
-        start_time = time.time()
+        # Simulate healing execution; elapsed time on the monotonic perf counter
+        start = time.perf_counter()
         
         # Consume resources
         self.healing_resources -= actuation.energy_required
         
         # Simulate success/failure based on probability
-        success = random.random() < actuation.success_probability
+        if success is None:
+            success = random.random() < actuation.success_probability
         
         evidence = {
             "success": success,
@@ -298,7 +340,7 @@ class MicroTransistorNode:
                 "duration": actuation.duration
             },
             "resources_consumed": actuation.energy_required,
-            "execution_time": time.time() - start_time,
+            "execution_time": time.perf_counter() - start,
             "timestamp": time.time(),
             "node_id": self.node_id
         }
@@ -307,23 +349,34 @@ class MicroTransistorNode:
     
     def get_sensor_readings(self) -> Dict[str, float]:
         """Get current sensor readings (simulated)"""
-        import random
         return {
-            "stress": random.uniform(0.0, 1.0),
-            "temperature": random.uniform(15.0, 200.0),
-            "vibration": random.uniform(0.0, 1.0),
-            "pressure": random.uniform(0.8, 1.2)
+            "stress": random.uniform(*SENSOR_STRESS_RANGE),
+            "temperature": random.uniform(*SENSOR_TEMPERATURE_RANGE_C),
+            "vibration": random.uniform(*SENSOR_VIBRATION_RANGE),
+            "pressure": random.uniform(*SENSOR_PRESSURE_RANGE)
         }
 
 
 class SelfHealingSurfaceController:
     """Integration layer between micro transistors and AQUA-OS with tile leader consensus"""
     
-    def __init__(self, surface_id: str, transistor_nodes: List[MicroTransistorNode]):
+    def __init__(self, surface_id: str, transistor_nodes: List[MicroTransistorNode],
+                 seed: Optional[int] = None):
         self.surface_id = surface_id
         self.nodes = {node.node_id: node for node in transistor_nodes}
         self.healing_history = []
         
+        # Per-node sensor inputs and assessment outputs (SoA, in self.nodes order)
+        node_count = len(self.nodes)
+        self._stress = np.zeros(node_count)
+        self._temperature = np.zeros(node_count)
+        self._vibration = np.zeros(node_count)
+        self._damage_type = np.zeros(node_count, dtype=np.int8)
+        self._severity = np.zeros(node_count)
+        self._confidence = np.zeros(node_count)
+        # Simulated sensor draws for all nodes per tick; pass a seed for repeatable runs
+        self._rng = np.random.default_rng(seed)
+        
         # Create tile leaders for consensus (0.01-0.1 m² patches)
         self.tile_leaders = self._create_tile_leaders(transistor_nodes)
         
@@ -360,11 +413,50 @@ class SelfHealingSurfaceController:
         
     def monitor_and_heal(self) -> Dict:
         """Main healing control loop"""
-        # Collect damage assessments from all nodes
+        # Simulated sensors are drawn for all nodes in one block, from the
+        # ranges of MicroTransistorNode.get_sensor_readings
+        nodes = list(self.nodes.values())
+        draws = self._rng.uniform(_DAMAGE_SENSOR_LOW, _DAMAGE_SENSOR_HIGH, size=(len(nodes), 3))
+        self._stress[:] = draws[:, 0]
+        self._temperature[:] = draws[:, 1]
+        self._vibration[:] = draws[:, 2]
+        
+        # Nodes with their own assessment are assessed individually; nodes with
+        # only their own sensor source are read individually into the batch
+        custom_reports = {}
+        for i, node in enumerate(nodes):
+            node.last_assessment = None
+            if _overrides(node, 'assess_damage'):
+                custom_reports[i] = node.assess_damage(node.get_sensor_readings())
+            elif _overrides(node, 'get_sensor_readings'):
+                self._stress[i], self._temperature[i], self._vibration[i] = \
+                    _damage_inputs(node.get_sensor_readings())
+        
+        # Assess all nodes in one batched pass
+        _assess_damage_kernel(self._stress, self._temperature, self._vibration,
+                              self._damage_type, self._severity, self._confidence)
+        
+        # Materialize assessments only for damaged nodes; nodes scanned clean
+        # have no current finding. Individually assessed nodes keep their report
+        assessment_time = time.time()
         damage_reports = []
-        for node_id, node in self.nodes.items():
-            sensor_readings = node.get_sensor_readings()
-            report = node.assess_damage(sensor_readings)
+        reported = np.flatnonzero(self._damage_type).tolist()
+        if custom_reports:
+            reported = sorted(set(reported).union(custom_reports))
+        for i in reported:
+            if i in custom_reports:
+                damage_reports.append(custom_reports[i])
+                continue
+            node = nodes[i]
+            report = DamageAssessment(
+                damage_type=_DAMAGE_TYPES[self._damage_type[i]],
+                severity=float(self._severity[i]),
+                confidence=float(self._confidence[i]),
+                timestamp=assessment_time,
+                node_id=node.node_id,
+                location=node.position.copy()
+            )
+            node.last_assessment = report
             damage_reports.append(report)
         
         # Determine which nodes need healing
@@ -384,11 +476,17 @@ class SelfHealingSurfaceController:
                     if report.severity > 0.7:
                         critical_damage = True
         
-        # Execute healing actions via tile leader consensus (2oo3)
+        # Execute healing actions via tile leader consensus (2oo3); outcomes
+        # are drawn for all actions at once and used by those that execute
         results = []
         consensus_failures = 0
+        success_draws = (
+            self._rng.random(len(healing_actions))
+            < np.fromiter((a["actuation"].success_probability for a in healing_actions),
+                          dtype=np.float64, count=len(healing_actions))
+        ).tolist()
         
-        for action in healing_actions:
+        for action, success in zip(healing_actions, success_draws):
             # Find which tile this node belongs to
             tile_leader = self._find_tile_leader_for_node(action["node_id"])
             
@@ -408,7 +506,7 @@ class SelfHealingSurfaceController:
                     if rta_approved:
                         # Execute healing action
                         node = self.nodes[action["node_id"]]
-                        result = node.execute_healing(action["actuation"])
+                        result = node.execute_healing(action["actuation"], success)
                         results.append({
                             "node_id": action["node_id"],
                             "assessment": action["assessment"],
@@ -438,7 +536,7 @@ class SelfHealingSurfaceController:
             else:
                 # No tile leader - emergency fallback (should not happen)
                 node = self.nodes[action["node_id"]]
-                result = node.execute_healing(action["actuation"])
+                result = node.execute_healing(action["actuation"], success)
                 results.append({
                     "node_id": action["node_id"],
                     "assessment": action["assessment"],
@@ -450,7 +548,7 @@ class SelfHealingSurfaceController:
         healing_summary = {
             "surface_id": self.surface_id,
             "timestamp": time.time(),
-            "nodes_assessed": len(damage_reports),
+            "nodes_assessed": len(nodes),
             "healing_actions": len(healing_actions),
             "consensus_failures": consensus_failures,
             "critical_damage": critical_damage,
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 UTCS-MI: AQUART-TEST-CODE-aeromorphic_tests-v1.0
-Test quantum aeromorphic nano-teleportation functionality
+Test quantum-assisted aeromorphic lattice optimization functionality
 """
 
 import unittest
@@ -11,72 +11,75 @@ import os
 # Add framework path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'framework'))
 from aeromorphic.nano_teleportation import (
-    QuantumTeleportationEngine,
+    QuantumAssistedOptimizer,
     AeromorphicLattice,
     QuantumAeromorphicIntegration,
     AeromorphicMaterial,
-    QuantumTeleportationState
+    QuantumOptimizationState
 )
 
 
-class TestQuantumTeleportationEngine(unittest.TestCase):
-    """Test quantum teleportation engine"""
+class TestQuantumAssistedOptimizer(unittest.TestCase):
+    """Test quantum-assisted reconfiguration optimizer"""
     
     def setUp(self):
         """Set up test environment"""
         self.material = AeromorphicMaterial(
             lattice_structure="hexagonal_carbon",
-            quantum_coherence=100.0,
-            entanglement_capacity=10,
-            energy_requirements=150.0
+            reconfiguration_time=0.5,
+            optimization_capacity=10,
+            energy_per_reconfiguration=0.01
         )
-        self.engine = QuantumTeleportationEngine(self.material)
+        self.optimizer = QuantumAssistedOptimizer(self.material)
         
-    def test_engine_initialization(self):
-        """Test quantum engine initialization"""
-        self.assertEqual(self.engine.material, self.material)
-        self.assertEqual(len(self.engine.entangled_pairs), 0)
-        self.assertEqual(self.engine.coherence_time, 100.0)
+    def test_optimizer_initialization(self):
+        """Test optimizer initialization"""
+        self.assertEqual(self.optimizer.material, self.material)
+        self.assertEqual(len(self.optimizer.optimization_cache), 0)
+        self.assertEqual(self.optimizer.reconfiguration_time, 0.5)
         
-    def test_entanglement_pair_creation(self):
-        """Test entanglement pair creation"""
-        result = self.engine.create_entanglement_pair("cell_001", "cell_002")
+    def test_reconfiguration_pattern_optimization(self):
+        """Test reconfiguration pattern optimization"""
+        result = self.optimizer.optimize_reconfiguration_pattern("cell_0_0_0", "cell_1_0_0")
         
-        # Should succeed with good material properties
+        # Should store an optimized path when it succeeds
         if result:
-            self.assertIn("cell_001", self.engine.entangled_pairs)
-            self.assertIn("cell_002", self.engine.entangled_pairs)
-            self.assertEqual(self.engine.entangled_pairs["cell_001"], "cell_002")
-            self.assertEqual(self.engine.entangled_pairs["cell_002"], "cell_001")
-        
-    def test_entanglement_capacity_limit(self):
-        """Test entanglement capacity limit"""
-        # Fill up entanglement capacity
-        for i in range(self.material.entanglement_capacity + 1):
-            self.engine.entangled_pairs[f"cell_{i:03d}"] = f"partner_{i:03d}"
+            self.assertIn(("cell_0_0_0", "cell_1_0_0"), self.optimizer.optimization_cache)
+            pattern = self.optimizer.optimization_cache[("cell_0_0_0", "cell_1_0_0")]
+            self.assertIn("optimized_path", pattern)
+            self.assertEqual(pattern["energy_cost"], 0.01)
+        
+    def test_optimization_capacity_limit(self):
+        """Test optimization capacity limit"""
+        # Fill up optimization capacity
+        for i in range(self.material.optimization_capacity):
+            self.optimizer.optimization_cache[(f"cell_{i}", f"partner_{i}")] = {}
             
-        # Should fail when capacity exceeded
-        result = self.engine.create_entanglement_pair("overflow_1", "overflow_2")
+        # Should fail when capacity reached
+        result = self.optimizer.optimize_reconfiguration_pattern("overflow_1", "overflow_2")
         self.assertFalse(result)
         
-    def test_quantum_teleportation_protocol(self):
-        """Test quantum teleportation protocol execution"""
-        source_cell = "cell_source"
-        target_location = [1.0, 2.0, 3.0]
+    def test_lattice_configuration_optimization(self):
+        """Test lattice configuration optimization state"""
+        target_profile = {
+            "cells": ["cell_0_0_0", "cell_1_1_1"],
+            "positions": [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+        }
         
-        try:
-            result = self.engine.quantum_teleportation_protocol(source_cell, target_location)
-            
-            self.assertIsInstance(result, QuantumTeleportationState)
-            self.assertEqual(result.source_cells, [source_cell])
-            self.assertEqual(result.target_locations, target_location)
-            self.assertGreater(result.fidelity, 0.0)
-            self.assertLessEqual(result.fidelity, 1.0)
-            self.assertEqual(len(result.quantum_state), 3)
-            
-        except ValueError as e:
-            # Acceptable if entanglement channel fails
-            self.assertIn("Failed to establish entanglement channel", str(e))
+        state = self.optimizer.optimize_lattice_configuration(target_profile)
+        
+        self.assertIsInstance(state, QuantumOptimizationState)
+        self.assertEqual(state.target_cells, ["cell_0_0_0", "cell_1_1_1"])
+        self.assertEqual(len(state.cost_function), 2)
+        self.assertIn("classical_cost", state.optimization_params)
+        self.assertGreater(state.convergence_fidelity, 0.0)
+        self.assertLessEqual(state.convergence_fidelity, 0.99)
+        
+    def test_fidelity_calculation(self):
+        """Test fidelity calculation"""
+        self.assertAlmostEqual(self.optimizer._calculate_fidelity([1.0, 0.0, 0.0], [1.0, 0.0, 0.0]), 1.0)
+        self.assertAlmostEqual(self.optimizer._calculate_fidelity([1.0, 0.0, 0.0], [0.0, 1.0, 0.0]), 0.0)
+        self.assertEqual(self.optimizer._calculate_fidelity([1.0, 0.0], [1.0, 0.0, 0.0]), 0.0)
 
 
 class TestAeromorphicLattice(unittest.TestCase):
@@ -91,71 +94,59 @@ class TestAeromorphicLattice(unittest.TestCase):
         """Test lattice initialization"""
         self.assertEqual(self.lattice.dimensions, self.dimensions)
         expected_cells = self.dimensions[0] * self.dimensions[1] * self.dimensions[2]
-        self.assertEqual(len(self.lattice.quantum_cells), expected_cells)
+        self.assertEqual(len(self.lattice.cell_ids), expected_cells)
+        self.assertEqual(self.lattice.positions.shape, (expected_cells, 3))
+        self.assertEqual(self.lattice.energy.shape, (expected_cells,))
         
         # Check cell structure
-        for cell_id, cell_data in self.lattice.quantum_cells.items():
-            self.assertIn("position", cell_data)
-            self.assertIn("quantum_state", cell_data)
-            self.assertEqual(len(cell_data["position"]), 3)
-            self.assertEqual(len(cell_data["quantum_state"]), 3)
-            
-    def test_aerodynamic_properties_calculation(self):
-        """Test aerodynamic properties calculation"""
-        properties = self.lattice.get_aerodynamic_properties()
-        
-        self.assertIsInstance(properties, dict)
-        self.assertIn("lift_coefficient", properties)
-        self.assertIn("drag_coefficient", properties)
-        self.assertIn("camber_ratio", properties)
-        self.assertIn("aspect_ratio", properties)
-        
-        # Validate reasonable ranges
-        self.assertGreaterEqual(properties["lift_coefficient"], 0.0)
-        self.assertLessEqual(properties["lift_coefficient"], 2.0)
-        self.assertGreaterEqual(properties["drag_coefficient"], 0.0)
-        self.assertLessEqual(properties["drag_coefficient"], 1.0)
-        
-    def test_cellular_transposition(self):
-        """Test cellular transposition execution"""
-        source_cell = "cell_0_0_0"
-        target_location = [1.5, 1.5, 0.5]
-        
-        # Get initial cell position
-        initial_position = self.lattice.quantum_cells[source_cell]["position"].copy()
-        
-        # Create quantum engine for the test
-        quantum_engine = QuantumTeleportationEngine(self.lattice.material_properties)
-        
-        try:
-            success = self.lattice.execute_cellular_transposition(
-                source_cell, target_location, quantum_engine
-            )
-            
-            if success:
-                # Check that position was updated
-                new_position = self.lattice.quantum_cells[source_cell]["position"]
-                self.assertEqual(new_position, target_location)
-                
-        except Exception:
-            # Transposition might fail due to quantum uncertainties
-            pass
+        cell = self.lattice.get_cell("cell_2_1_1")
+        self.assertEqual(cell["position"], [2.0, 1.0, 1.0])
+        self.assertEqual(cell["material_state"], "solid")
+        self.assertTrue(cell["reconfiguration_ready"])
+        self.assertEqual(cell["energy_level"], 0.0)
+        
+    def test_classical_reconfiguration(self):
+        """Test classical reconfiguration execution"""
+        optimization_state = QuantumOptimizationState(
+            target_cells=["cell_0_0_0", "cell_1_1_1", "cell_unknown"],
+            target_positions=[1.5, 1.5, 0.5, 2.0, 2.0, 1.0, 9.0, 9.0, 9.0],
+            optimization_params={"classical_cost": 0.01},
+            cost_function=[0.5, 0.5, 0.5],
+            convergence_fidelity=0.95
+        )
+        
+        success = self.lattice._execute_classical_reconfiguration(optimization_state)
+        
+        self.assertTrue(success)
+        self.assertEqual(self.lattice.get_cell("cell_0_0_0")["position"], [1.5, 1.5, 0.5])
+        self.assertEqual(self.lattice.get_cell("cell_1_1_1")["position"], [2.0, 2.0, 1.0])
+        self.assertAlmostEqual(self.lattice.get_cell("cell_1_1_1")["energy_level"], 0.01, places=6)
+        # Untouched cells keep their grid position
+        self.assertEqual(self.lattice.get_cell("cell_2_2_1")["position"], [2.0, 2.0, 1.0])
+        self.assertEqual(self.lattice.get_cell("cell_2_2_1")["energy_level"], 0.0)
             
-    def test_optimization_planning(self):
-        """Test aerodynamic optimization planning"""
+    def test_seeded_random_streams(self):
+        """Test seeded lattices are reproducible and worker streams independent"""
+        lattice_a = AeromorphicLattice(self.dimensions, seed=1234)
+        lattice_b = AeromorphicLattice(self.dimensions, seed=1234)
+        target_profile = {"cells": ["cell_0_0_0", "cell_1_1_1"], "positions": []}
+        
+        state_a = lattice_a.quantum_optimizer.optimize_lattice_configuration(target_profile)
+        state_b = lattice_b.quantum_optimizer.optimize_lattice_configuration(target_profile)
+        self.assertEqual(state_a.cost_function, state_b.cost_function)
+        
+        workers = lattice_a.spawn_rngs(2)
+        self.assertNotEqual(workers[0].random(), workers[1].random())
+        
+    def test_low_convergence_rejected(self):
+        """Test that low-convergence optimizations are not executed"""
         target_profile = {
-            "drag_coefficient": 0.1,
-            "lift_coefficient": 1.5
+            "cells": ["cell_0_0_0"],
+            "positions": [5.0, 5.0, 5.0]
         }
         
-        plan = self.lattice._calculate_transposition_plan(target_profile)
-        
-        self.assertIsInstance(plan, list)
-        # Plan might be empty if no optimization needed
-        for transposition in plan:
-            self.assertIn("source", transposition)
-            self.assertIn("target", transposition)
-            self.assertIn("reason", transposition)
+        self.assertFalse(self.lattice.optimize_aerodynamic_profile(target_profile))
+        self.assertEqual(self.lattice.get_cell("cell_0_0_0")["position"], [0.0, 0.0, 0.0])
 
 
 class TestQuantumAeromorphicIntegration(unittest.TestCase):
@@ -168,10 +159,27 @@ class TestQuantumAeromorphicIntegration(unittest.TestCase):
         
     def test_integration_initialization(self):
         """Test integration system initialization"""
-        self.assertIsNotNone(self.integration.aeromorphic_lattice)
-        self.assertEqual(self.integration.aeromorphic_lattice.dimensions, self.surface_dimensions)
+        self.assertIsNotNone(self.integration.lattice)
+        self.assertEqual(self.integration.lattice.dimensions, self.surface_dimensions)
         self.assertEqual(len(self.integration.optimization_history), 0)
         
+    def test_surface_configuration_optimization(self):
+        """Test surface configuration optimization"""
+        aerodynamic_target = {
+            "cells": self.integration.lattice.cell_ids[:6],
+            "positions": [float(i) for i in range(18)]
+        }
+        
+        result = self.integration.optimize_surface_configuration(aerodynamic_target)
+        
+        self.assertIsInstance(result, dict)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["optimization_method"], "quantum_assisted_classical")
+        self.assertEqual(result["physical_transport"], "classical_only")
+        self.assertIn("duration", result)
+        self.assertIn("energy_consumed", result)
+        self.assertEqual(len(self.integration.optimization_history), 1)
+        
     def test_surface_optimization(self):
         """Test aircraft surface optimization"""
         flight_conditions = {
@@ -188,7 +196,6 @@ class TestQuantumAeromorphicIntegration(unittest.TestCase):
         self.assertIn("current_profile", result)
         self.assertIn("target_profile", result)
         self.assertIn("new_profile", result)
-        self.assertIn("performance_improvement", result)
         
         # Check performance improvement structure
         improvement = result["performance_improvement"]
@@ -197,27 +204,23 @@ class TestQuantumAeromorphicIntegration(unittest.TestCase):
         self.assertIn("ld_ratio_improvement_percent", improvement)
         self.assertIn("overall_efficiency_gain", improvement)
         
-    def test_optimal_profile_calculation(self):
-        """Test optimal profile calculation"""
-        current_profile = {
-            "lift_coefficient": 1.0,
-            "drag_coefficient": 0.2
-        }
+    def test_batched_optimal_profile_calculation(self):
+        """Test batched optimal profile calculation"""
+        conditions = [
+            [35000, 250, 3.0],
+            [10000, 150, 8.0]
+        ]
         
-        flight_conditions = {
-            "altitude": 35000,
-            "speed": 250,
-            "aoa": 3.0
-        }
-        
-        target_profile = self.integration._calculate_optimal_profile(
-            current_profile, flight_conditions
-        )
+        targets = self.integration.optimize_aircraft_surface_batch(conditions)
         
-        self.assertIsInstance(target_profile, dict)
-        self.assertIn("lift_coefficient", target_profile)
-        self.assertIn("drag_coefficient", target_profile)
-        self.assertIn("optimization_reason", target_profile)
+        self.assertEqual(targets.shape, (2, 2))
+        for row, condition in zip(targets, conditions):
+            single = self.integration._calculate_optimal_profile([condition])[0]
+            self.assertAlmostEqual(row[0], single[0])
+            self.assertAlmostEqual(row[1], single[1])
+        self.assertTrue(((targets[:, 0] >= 0.0) & (targets[:, 0] <= 2.0)).all())
+        self.assertTrue(((targets[:, 1] > 0.0) & (targets[:, 1] <= 1.0)).all())
+        self.assertEqual(len(self.integration.optimization_history), 2)
         
     def test_performance_improvement_calculation(self):
         """Test performance improvement calculation"""
@@ -251,16 +254,16 @@ class TestAeromorphicMaterial(unittest.TestCase):
         """Test material property validation"""
         material = AeromorphicMaterial(
             lattice_structure="diamond_cubic",
-            quantum_coherence=200.0,
-            entanglement_capacity=100,
-            energy_requirements=75.0
+            reconfiguration_time=0.2,
+            optimization_capacity=100,
+            energy_per_reconfiguration=0.05
         )
         
         self.assertEqual(material.lattice_structure, "diamond_cubic")
-        self.assertEqual(material.quantum_coherence, 200.0)
-        self.assertEqual(material.entanglement_capacity, 100)
-        self.assertEqual(material.energy_requirements, 75.0)
+        self.assertEqual(material.reconfiguration_time, 0.2)
+        self.assertEqual(material.optimization_capacity, 100)
+        self.assertEqual(material.energy_per_reconfiguration, 0.05)
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+UTCS-MI: AQUART-TEST-CODE-amedeo_integration_demo_tests-v1.0
+Test the integrated AMEDEO demo's background learning worker
+"""
+
+import unittest
+import asyncio
+import tempfile
+import sys
+import os
+
+import numpy as np
+
+# Add repository root; the demo imports framework, tools and domains as packages
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from framework.aeromorphic.run_amedeo_integration_demo import (
+    AMEDEOIntegratedSystem,
+    LEARNING_WINDOW,
+    _RING_METRICS
+)
+from tools.det import DigitalEvidenceTwin, BatchedDETSink
+
+
+class TestLearningWorker(unittest.IsolatedAsyncioTestCase):
+    """Test queued learning analyses run to completion"""
+
+    async def asyncSetUp(self):
+        """Set up test environment"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.system = AMEDEOIntegratedSystem(seed=0)
+        self.det = DigitalEvidenceTwin(logfile=os.path.join(self.tmpdir.name, "det_events.log"))
+        self.system.det_sink = BatchedDETSink(self.det)
+        self.system.det_sink.start()
+        self.worker = asyncio.create_task(self.system._learning_worker())
+
+    async def asyncTearDown(self):
+        """Stop the worker and flush the evidence sink"""
+        self.worker.cancel()
+        await asyncio.gather(self.worker, return_exceptions=True)
+        await self.system.det_sink.close()
+
+    async def test_learning_sessions_complete_after_queue_join(self):
+        """Test every queued window is analysed once the queue is joined"""
+        # Second half scores higher, so each session counts as a successful adaptation
+        improving = np.full((LEARNING_WINDOW, len(_RING_METRICS)), 0.5)
+        improving[LEARNING_WINDOW // 2:] = 0.8
+        for _ in range(3):
+            self.system._learning_queue.put_nowait(improving)
+
+        await self.system._learning_queue.join()
+
+        self.assertEqual(self.system.learning_sessions, 3)
+        self.assertEqual(self.system.successful_adaptations, 3)
+        self.assertFalse(self.worker.done())
+
+        await self.system.det_sink.flush()
+        events = self.det.get_events()
+        self.assertEqual(
+            [e["learning_session"] for e in events if e["event"] == "autogenesis_learning_success"],
+            [1, 2, 3]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
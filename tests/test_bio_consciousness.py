@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+UTCS-MI: AQUART-TEST-CODE-bio_consciousness_tests-v1.0
+Test consciousness metric measurement and comprehensive assessment
+"""
+
+import unittest
+import sys
+import os
+
+# Add framework path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'framework'))
+from bio_integration.bio_consciousness import ConsciousnessMeter
+
+
+class TestConsciousnessMeter(unittest.TestCase):
+    """Test consciousness metrics and their combined score"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.meter = ConsciousnessMeter()
+        self.system_data = {
+            "neural_activity": {"global_broadcast": 0.9},
+            "responses": {"introspection_quality": 0.4},
+            "behavior": {},  # experience_markers falls back to its default
+            "meta_cognition": {"self_model_accuracy": 0.95}
+        }
+
+    def individual_metrics(self, system_data):
+        """Metrics from the per-protocol measure_* methods"""
+        return [
+            self.meter.measure_integrated_information(system_data),
+            self.meter.measure_global_accessibility(system_data.get("neural_activity", {})),
+            self.meter.measure_reportability(system_data.get("responses", {})),
+            self.meter.measure_subjective_experience(system_data.get("behavior", {})),
+            self.meter.measure_self_awareness(system_data.get("meta_cognition", {}))
+        ]
+
+    def test_measure_methods_read_their_own_inputs(self):
+        """Test each measure_* method reads its key and falls back to its default"""
+        metrics = self.individual_metrics(self.system_data)
+
+        self.assertEqual([m.name for m in metrics], self.meter.measurement_protocols)
+        self.assertEqual([m.value for m in metrics[1:]], [0.9, 0.4, 0.5, 0.95])
+        self.assertEqual([m.confidence for m in metrics], [0.8, 0.7, 0.9, 0.6, 0.8])
+        self.assertEqual(metrics[3].measurement_method, "behavioral_analysis")
+        self.assertEqual(self.meter.measure_self_awareness({}).value, 0.7)
+
+    def test_assessment_matches_confidence_weighted_mean(self):
+        """Test the overall score is the confidence-weighted mean of the individual metrics"""
+        metrics = self.individual_metrics(self.system_data)
+        expected = sum(m.value * m.confidence for m in metrics) / sum(m.confidence for m in metrics)
+
+        assessment = self.meter.comprehensive_assessment(self.system_data)
+
+        self.assertAlmostEqual(assessment.overall_score, expected)
+        self.assertEqual(
+            [(m.name, m.value, m.confidence, m.measurement_method) for m in assessment.metrics],
+            [(m.name, m.value, m.confidence, m.measurement_method) for m in metrics]
+        )
+        self.assertEqual(assessment.verified, expected >= 0.7)
+
+    def test_assessment_uses_one_timestamp(self):
+        """Test every metric and the assessment share one timestamp"""
+        assessment = self.meter.comprehensive_assessment(self.system_data)
+        self.assertEqual({m.timestamp for m in assessment.metrics}, {assessment.timestamp})
+
+        stamped = self.meter.comprehensive_assessment(self.system_data, now=1234567890.0)
+        self.assertEqual(stamped.timestamp, 1234567890.0)
+        self.assertTrue(all(m.timestamp == 1234567890.0 for m in stamped.metrics))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+UTCS-MI: AQUART-TEST-CODE-p2af_economics_tests-v1.0
+Test corruption-proof economics ledger and transaction processing
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Add framework path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'framework'))
+from p2af_economics.corruption_proof_economics import (
+    BlockchainLedger,
+    CorruptionDetectionEngine,
+    CorruptionProofEconomics,
+    EconomicTransaction,
+    EthicsMonitor,
+    EthicsViolation,
+    TransactionType
+)
+
+
+def make_transaction(index, from_entity="ENTITY_A", to_entity="ENTITY_B", amount=100.0):
+    """Build a signed-placeholder transaction for tests"""
+    return EconomicTransaction(
+        transaction_id=f"TX_{index:04d}",
+        transaction_type=TransactionType.PAYMENT,
+        from_entity=from_entity,
+        to_entity=to_entity,
+        amount=amount,
+        currency="EUR",
+        purpose="test payment",
+        evidence_hash=f"evidence_{index}",
+        timestamp=time.time(),
+        digital_signature="test_signature"
+    )
+
+
+class TestBlockchainLedger(unittest.TestCase):
+    """Test block hashing and mining"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.ledger = BlockchainLedger()
+
+    def test_mined_block_hash_round_trip(self):
+        """Test a mined block's stored hash matches a recomputation"""
+        for i in range(3):
+            self.assertTrue(self.ledger.add_transaction(make_transaction(i)))
+        self.assertTrue(self.ledger.mine_block())
+
+        block = self.ledger.chain[-1]
+        self.assertEqual(len(block["transactions"]), 3)
+        self.assertEqual(self.ledger.calculate_hash(block), block["hash"])
+        self.assertEqual(block["previous_hash"], self.ledger.chain[0]["hash"])
+
+    def test_block_hash_covers_recorded_contents(self):
+        """Test the hash covers field values as recorded at mine time"""
+        transaction = make_transaction(0)
+        self.ledger.add_transaction(transaction)
+        transaction.amount = 999.0
+        self.ledger.mine_block()
+
+        block = self.ledger.chain[-1]
+        self.assertEqual(block["transactions"][0]["amount"], 999.0)
+        self.assertEqual(self.ledger.calculate_hash(block), block["hash"])
+
+    def test_tampered_block_changes_hash(self):
+        """Test editing a recorded transaction invalidates the block hash"""
+        self.ledger.add_transaction(make_transaction(0))
+        self.ledger.mine_block()
+
+        block = self.ledger.chain[-1]
+        block["transactions"][0]["amount"] = 1.0
+        self.assertNotEqual(self.ledger.calculate_hash(block), block["hash"])
+
+    def test_columns_cover_all_mined_blocks(self):
+        """Test columns read between and after several blocks list every mined row in order"""
+        for i in range(5):
+            self.ledger.add_transaction(make_transaction(i, amount=float(i)))
+            self.ledger.mine_block()
+            if i == 2:
+                self.assertEqual(len(self.ledger.columns), 3)
+
+        columns = self.ledger.columns
+        self.assertEqual(columns.transaction_ids.tolist(), [f"TX_{i:04d}" for i in range(5)])
+        self.assertEqual(columns.amounts.tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(self.ledger.get_transaction_columns("ENTITY_B").amounts.tolist(),
+                         [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_history_unaffected_by_edits_after_mining(self):
+        """Test history keeps the mined values when the submitted object changes later"""
+        transaction = make_transaction(0)
+        self.ledger.add_transaction(transaction)
+        self.ledger.mine_block()
+        transaction.amount = 1e9
+
+        history = self.ledger.get_transaction_history("ENTITY_A")
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0].amount, 100.0)
+        self.assertEqual(history[0].transaction_type, TransactionType.PAYMENT)
+        self.assertTrue(self.ledger.validate_transaction(history[0]))
+        self.assertEqual(self.ledger.get_transaction_columns("ENTITY_A").amounts.tolist(), [100.0])
+
+
+class TestCorruptionDetectionEngine(unittest.TestCase):
+    """Test the circular-pair and unusual-amount scans"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.engine = CorruptionDetectionEngine()
+
+    def circular_ids(self, transactions):
+        """Transaction ids flagged as circular"""
+        return [v.evidence["transaction_id"]
+                for v in self.engine.detect_circular_transactions(transactions)]
+
+    def test_first_occurrence_of_pair_not_flagged(self):
+        """Test a pair seen once is not circular"""
+        transactions = [
+            make_transaction(0, "A", "B"),
+            make_transaction(1, "A", "C"),
+            make_transaction(2, "C", "D")
+        ]
+        self.assertEqual(self.circular_ids(transactions), [])
+
+    def test_reversed_pair_flagged(self):
+        """Test B->A after A->B is flagged, but not the original A->B"""
+        transactions = [
+            make_transaction(0, "A", "B"),
+            make_transaction(1, "A", "C"),
+            make_transaction(2, "B", "A"),
+            make_transaction(3, "A", "B")
+        ]
+        violations = self.engine.detect_circular_transactions(transactions)
+        self.assertEqual([v.evidence["transaction_id"] for v in violations], ["TX_0002", "TX_0003"])
+        self.assertEqual(violations[0].involved_parties, ["B", "A"])
+        self.assertEqual(violations[0].violation_type, "circular_transaction")
+
+    def test_repeated_self_pair_flagged(self):
+        """Test a second A->A transaction is flagged"""
+        transactions = [make_transaction(0, "A", "A"), make_transaction(1, "A", "A")]
+        self.assertEqual(self.circular_ids(transactions), ["TX_0001"])
+
+    def test_empty_input_returns_no_violations(self):
+        """Test both scans accept an empty transaction list"""
+        self.assertEqual(self.engine.detect_circular_transactions([]), [])
+        self.assertEqual(self.engine.analyze_transaction_patterns([]), [])
+
+    def test_unusual_amount_flagged_with_average(self):
+        """Test an amount above ten times the mean is flagged with that mean as evidence"""
+        amounts = [1.0] * 19 + [1000.0]
+        transactions = [make_transaction(i, amount=a) for i, a in enumerate(amounts)]
+
+        violations = self.engine.analyze_transaction_patterns(transactions)
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].violation_id, "PATTERN_TX_0019")
+        self.assertEqual(violations[0].violation_type, "unusual_amount")
+        self.assertEqual(violations[0].evidence["amount"], 1000.0)
+        self.assertAlmostEqual(violations[0].evidence["average"], sum(amounts) / len(amounts))
+        self.assertEqual(violations[0].involved_parties, ["ENTITY_A", "ENTITY_B"])
+
+    def test_uniform_amounts_not_flagged(self):
+        """Test amounts within ten times the mean are not flagged"""
+        transactions = [make_transaction(i, amount=a) for i, a in enumerate([1.0, 1.0, 1.0])]
+        self.assertEqual(self.engine.analyze_transaction_patterns(transactions), [])
+
+
+class LimitEthicsMonitor(EthicsMonitor):
+    """Ethics monitor enforcing an additional maximum transaction amount"""
+
+    _ENFORCED_RULES = EthicsMonitor._ENFORCED_RULES + (
+        ("maximum_transaction_limits", "_check_limit", "_screen_limit"),
+    )
+
+    def _check_limit(self, transaction, now):
+        """Flag transactions above the limit"""
+        if transaction.amount <= 1000.0:
+            return None
+        return EthicsViolation(
+            violation_id=f"LIMIT_{transaction.transaction_id}",
+            violation_type="limit_exceeded",
+            severity="critical",
+            involved_parties=[transaction.from_entity],
+            evidence={"amount": transaction.amount},
+            detected_by="ethics_monitor",
+            timestamp=now
+        )
+
+    @staticmethod
+    def _screen_limit(transactions):
+        """Rows _check_limit flags"""
+        return transactions.amounts > 1000.0
+
+
+class TestCorruptionProofEconomics(unittest.TestCase):
+    """Test transaction processing"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.transactions = [
+            make_transaction(0),
+            make_transaction(1, to_entity="ENTITY_A"),  # Self-dealing
+            make_transaction(2, from_entity="ENTITY_C", amount=5000.0),
+            make_transaction(3, from_entity="ENTITY_B", to_entity="ENTITY_B"),  # Self-dealing
+        ]
+
+    def assert_batch_matches_scalar(self, monitor_factory):
+        """Process the transactions both ways and compare the outcomes"""
+        scalar_system = CorruptionProofEconomics()
+        scalar_system.ethics_monitor = monitor_factory()
+        scalar = [scalar_system.process_transaction(t) for t in self.transactions]
+        batch_system = CorruptionProofEconomics()
+        batch_system.ethics_monitor = monitor_factory()
+        batch = batch_system.process_transactions(self.transactions)
+
+        self.assertEqual([r["approved"] for r in batch], [r["approved"] for r in scalar])
+        self.assertEqual(
+            [[v.violation_type for v in r["violations"]] for r in batch],
+            [[v.violation_type for v in r["violations"]] for r in scalar]
+        )
+        self.assertEqual(
+            [t.transaction_id for t in batch_system.ledger.pending_transactions],
+            [t.transaction_id for t in scalar_system.ledger.pending_transactions]
+        )
+        return batch
+
+    def test_batch_matches_per_transaction_processing(self):
+        """Test process_transactions gives the same outcome as process_transaction"""
+        batch = self.assert_batch_matches_scalar(EthicsMonitor)
+        self.assertEqual([r["approved"] for r in batch], [True, False, True, False])
+
+    def test_batch_screen_follows_added_rules(self):
+        """Test a rule added to the monitor is applied by the batch path too"""
+        batch = self.assert_batch_matches_scalar(LimitEthicsMonitor)
+        self.assertEqual([r["approved"] for r in batch], [True, False, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
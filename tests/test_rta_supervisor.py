@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+UTCS-MI: AQUART-TEST-CODE-rta_supervisor_tests-v1.0
+Test RTA supervisor duty-cycle limiting and recent safety maxima
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add safety framework path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'framework', 'safety'))
+import rta_supervisor
+from rta_supervisor import RTASupervisor, SafetyEnvelope
+
+SECOND_NS = 1_000_000_000
+LOW_IMPACT_PATTERN = [0.5, 0.5, 0.5]
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now_ns = 10 * SECOND_NS
+
+    def advance(self, seconds):
+        """Move the clock forward"""
+        self.now_ns += int(seconds * SECOND_NS)
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def time(self):
+        return self.now_ns / SECOND_NS
+
+
+class TestRTASupervisor(unittest.TestCase):
+    """Test RTA supervisor tracking of approved operations"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.clock = FakeClock()
+        patcher = mock.patch.object(rta_supervisor, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # 10% duty cycle allows 6 s of on-time per minute
+        self.supervisor = RTASupervisor(SafetyEnvelope(
+            max_temperature_delta=20.0,
+            max_current=2.0,
+            max_duty_cycle=0.10,
+            thermal_timeout=30.0
+        ))
+
+    def test_duty_cycle_accumulates_until_limit(self):
+        """Test approved on-time adds up and the limit rejects further operations"""
+        for _ in range(3):
+            self.assertTrue(self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 2.0))
+            self.clock.advance(1.0)
+
+        self.assertAlmostEqual(self.supervisor.get_safety_status()["current_duty_cycle"], 0.10)
+        decision = self.supervisor.approve_with_details(LOW_IMPACT_PATTERN, 0.01, 2.0)
+        self.assertFalse(decision.approved)
+        self.assertAlmostEqual(decision.safety_constraints["duty_cycle"], 8.0 / 60.0)
+        self.assertFalse(self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 2.0))
+
+    def test_duty_cycle_window_expires_old_operations(self):
+        """Test on-time older than a minute no longer counts"""
+        self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 3.0)
+        self.clock.advance(30.0)
+        self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 3.0)
+        self.assertAlmostEqual(self.supervisor.get_safety_status()["current_duty_cycle"], 0.10)
+
+        self.clock.advance(30.0)
+        self.assertAlmostEqual(self.supervisor.get_safety_status()["current_duty_cycle"], 0.05)
+        self.assertTrue(self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 3.0))
+
+        self.clock.advance(61.0)
+        self.assertEqual(self.supervisor.get_safety_status()["current_duty_cycle"], 0.0)
+
+    def test_probes_and_rejections_do_not_record_on_time(self):
+        """Test only approve() with an approved outcome counts towards the duty cycle"""
+        for _ in range(5):
+            self.assertTrue(self.supervisor.approve_with_details(LOW_IMPACT_PATTERN, 0.01, 2.0).approved)
+        self.assertFalse(self.supervisor.approve(LOW_IMPACT_PATTERN, 0.01, 7.0))
+
+        status = self.supervisor.get_safety_status()
+        self.assertEqual(status["current_duty_cycle"], 0.0)
+        self.assertEqual(status["max_recent_current"], 0.0)
+        self.assertEqual(len(self.supervisor.duty_cycle_tracker), 0)
+
+    def test_recent_maxima_follow_their_windows(self):
+        """Test recent temperature and current maxima expire over their own windows"""
+        large = self.supervisor.approve_with_details([1.0, 1.0, 1.0], 0.5, 0.5).safety_constraints
+        small = self.supervisor.approve_with_details(LOW_IMPACT_PATTERN, 0.1, 0.5).safety_constraints
+        self.assertGreater(large["current"], small["current"])
+        self.assertGreater(large["thermal_delta"], small["thermal_delta"])
+
+        self.assertTrue(self.supervisor.approve([1.0, 1.0, 1.0], 0.5, 0.5))
+        self.clock.advance(30.0)
+        self.assertTrue(self.supervisor.approve(LOW_IMPACT_PATTERN, 0.1, 0.5))
+
+        status = self.supervisor.get_safety_status()
+        self.assertAlmostEqual(status["max_recent_current"], large["current"])
+        self.assertAlmostEqual(status["max_recent_temp_delta"], large["thermal_delta"])
+
+        # Current window is one minute, temperature window five
+        self.clock.advance(31.0)
+        status = self.supervisor.get_safety_status()
+        self.assertAlmostEqual(status["max_recent_current"], small["current"])
+        self.assertAlmostEqual(status["max_recent_temp_delta"], large["thermal_delta"])
+
+        self.clock.advance(240.0)
+        status = self.supervisor.get_safety_status()
+        self.assertEqual(status["max_recent_current"], 0.0)
+        self.assertAlmostEqual(status["max_recent_temp_delta"], small["thermal_delta"])
+
+    def test_window_max_keeps_later_smaller_values(self):
+        """Test the monotonic window reports the next largest value once the max expires"""
+        window = self.supervisor._temp_window
+        for second, value in enumerate([3.0, 5.0, 4.0, 1.0, 2.0]):
+            RTASupervisor._push_window_max(window, second * SECOND_NS, value)
+
+        self.assertEqual([value for _, value in window], [5.0, 4.0, 2.0])
+        self.assertEqual(RTASupervisor._window_max(window, 4 * SECOND_NS, 10 * SECOND_NS), 5.0)
+        self.assertEqual(RTASupervisor._window_max(window, 11 * SECOND_NS, 10 * SECOND_NS), 4.0)
+        self.assertEqual(RTASupervisor._window_max(window, 12 * SECOND_NS, 10 * SECOND_NS), 2.0)
+        self.assertEqual(RTASupervisor._window_max(window, 14 * SECOND_NS, 10 * SECOND_NS), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -209,7 +209,50 @@ class TestSelfHealingSurfaceController(unittest.TestCase):
         self.assertEqual(result["nodes_assessed"], 5)
         # The stress of 0.9 should trigger healing (above 0.8 threshold)
         self.assertGreaterEqual(result["healing_actions"], 1)
-        
+
+    def test_batch_assessment_matches_node_assessment(self):
+        """Test the controller's batched assessment agrees with assess_damage per node"""
+        nodes = [MicroTransistorNode(f"node_{i:03d}", [float(i), 0.0, 0.0]) for i in range(200)]
+        controller = SelfHealingSurfaceController("batch_surface", nodes, seed=7)
+        controller.monitor_and_heal()
+
+        for i, node in enumerate(nodes):
+            scalar = MicroTransistorNode("scalar", node.position).assess_damage({
+                "stress": controller._stress[i],
+                "temperature": controller._temperature[i],
+                "vibration": controller._vibration[i]
+            })
+            if scalar.damage_type == "none":
+                self.assertIsNone(node.last_assessment)
+                continue
+            self.assertEqual(node.last_assessment.damage_type, scalar.damage_type)
+            self.assertEqual(node.last_assessment.severity, scalar.severity)
+            self.assertEqual(node.last_assessment.confidence, scalar.confidence)
+
+    def test_monitor_and_heal_uses_overridden_assessment(self):
+        """Test a node subclass with its own assess_damage is not bypassed"""
+        class AlwaysCrackedNode(MicroTransistorNode):
+            def assess_damage(self, sensor_readings):
+                return DamageAssessment(
+                    damage_type="stress_crack",
+                    severity=0.9,
+                    confidence=0.99,
+                    timestamp=1234567890.0,
+                    node_id=self.node_id,
+                    location=self.position.copy()
+                )
+
+        cracked = AlwaysCrackedNode("node_cracked", [9.0, 0.0, 0.0])
+        for node in self.nodes + [cracked]:
+            node.get_sensor_readings = lambda: {"stress": 0.1, "temperature": 25.0, "vibration": 0.05}
+        controller = SelfHealingSurfaceController("test_surface", self.nodes + [cracked])
+
+        result = controller.monitor_and_heal()
+
+        self.assertEqual(result["healing_actions"], 1)
+        self.assertTrue(result["critical_damage"])
+        self.assertEqual(result["results"][0]["node_id"], "node_cracked")
+
     def test_health_status_reporting(self):
         """Test health status reporting"""
         status = self.controller.get_health_status()
@@ -5,15 +5,35 @@ Digital Evidence Twin (DET) - Minimal runtime stub for demos/tests.
 Provides async initialize() and log_event() APIs used by AMEDEO demos.
 This lightweight implementation stores events in memory and optionally
 writes a compact line to a local logfile for traceability.
+
+BatchedDETSink queues events from hot loops and hands them to the DET in
+batches through log_events_batch(), so a burst of events costs one logfile
+append instead of one per event.
+
+Logfile lines are encoded with orjson when it is installed (NumPy arrays and
+scalars serialize directly), falling back to the stdlib json module.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import time
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_line(event: Dict[str, Any]) -> bytes:
+    """Encode one event as a UTF-8 NDJSON line"""
+    if orjson is not None:
+        return orjson.dumps(event, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class DigitalEvidenceTwin:
     """Simple in-memory DET used for local demonstration runs."""
@@ -36,11 +56,96 @@ class DigitalEvidenceTwin:
         self._events.append(event)
         # Write compact NDJSON line for quick inspection (best-effort)
         try:
-            with open(self._logfile, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            with open(self._logfile, "ab") as f:
+                f.write(_encode_line(event))
         except Exception:
             # Non-fatal in demo context
             pass
 
+    async def log_events_batch(self, events: List[Dict[str, Any]]) -> None:
+        # Same semantics as log_event() for each event, with a single append
+        now = time.time()
+        lines = []
+        for event in events:
+            if "timestamp" not in event:
+                event["timestamp"] = now
+            try:
+                lines.append(_encode_line(event))
+            except Exception:
+                # Non-fatal in demo context; event is still kept in memory
+                pass
+        self._events.extend(events)
+        try:
+            with open(self._logfile, "ab") as f:
+                f.write(b"".join(lines))
+        except Exception:
+            pass
+
     def get_events(self) -> List[Dict[str, Any]]:
         return list(self._events)
+
+
+class BatchedDETSink:
+    """Non-blocking front end that forwards queued events to a DET in batches.
+
+    log() enqueues without awaiting; a background task drains the queue into
+    DigitalEvidenceTwin.log_events_batch(). When the queue is full the oldest
+    event is dropped. Call flush() before reading back events, and close()
+    when done to stop the background task. Events in batches the DET failed
+    to record are counted in failed_events and logged.
+    """
+
+    def __init__(self, det: DigitalEvidenceTwin, max_batch: int = 128,
+                 maxsize: int = 4096, linger: float = 0.05):
+        self._det = det
+        self.max_batch = max_batch
+        self.linger = linger
+        self.dropped_events = 0
+        self.failed_events = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._drainer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+
+    def log(self, event: Dict[str, Any]) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped_events += 1
+        self._queue.put_nowait(event)
+
+    async def flush(self) -> None:
+        self.start()
+        await self._queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._drainer is not None:
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+            self._drainer = None
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self.linger > 0 and self._queue.qsize() < self.max_batch:
+                # Let a few more events accumulate before writing
+                await asyncio.sleep(self.linger)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._det.log_events_batch(batch)
+            except Exception as e:
+                # Evidence logging must never stall the producer, but lost
+                # evidence is counted and reported
+                self.failed_events += len(batch)
+                logging.error("DET batch of %d events not recorded (%d failed in total): %s",
+                              len(batch), self.failed_events, e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()